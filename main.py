@@ -1,9 +1,9 @@
 import inquirer
 from rich.console import Console
 from src.db_utils import test_db_connection, check_db_connection_with_friendly_error
-from src.search_utils import search_database
+from src.search_utils import search_database, clear_schema_cache
 from src.export_menu import export_menu
-from src.search_replace import search_and_replace_menu
+from src.search_replace import search_and_replace_menu, clear_schema_cache as clear_search_replace_schema_cache
 
 console = Console()
 
@@ -37,6 +37,9 @@ def main():
             break
 
         if answers["option"] == "1. Test DB Connection":
+            # Re-read the schema on the next search in case tables changed
+            clear_schema_cache()
+            clear_search_replace_schema_cache()
             test_db_connection()
         elif answers["option"] == "2. Search":
             search_database()
@@ -1,6 +1,7 @@
 import os
 from urllib.parse import quote_plus
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import text  # Import text for raw SQL queries
 from rich.console import Console
 from dotenv import load_dotenv  # Import dotenv
@@ -16,6 +17,13 @@ _inspector = None
 _connection_status = None
 _connection_error = None
 
+# Connection pool settings for the shared engine. Connections are reused across the
+# many short connect() blocks of an interactive session, checked before use and
+# recycled before typical MySQL wait_timeout / hosting proxy limits drop them.
+POOL_SIZE = 5
+POOL_MAX_OVERFLOW = 10
+POOL_RECYCLE_SECONDS = 1800
+
 def validate_db_config():
     """Validate that all required database configuration is present."""
     required_vars = ['DB_HOST', 'DB_USER', 'DB_PASSWORD', 'DB_NAME']
@@ -58,7 +66,14 @@ def get_db_engine():
         encoded_db_name = quote_plus(db_name)
 
         db_url = f"mysql+pymysql://{encoded_user}:{encoded_password}@{db_host}:{db_port}/{encoded_db_name}"
-        _engine = create_engine(db_url)
+        _engine = create_engine(
+            db_url,
+            poolclass=QueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=POOL_RECYCLE_SECONDS,
+        )
         return _engine
     except Exception as e:
         _connection_status = "engine_error"
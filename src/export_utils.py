@@ -1,4 +1,5 @@
 import os
+import re
 import json
 import csv
 import datetime
@@ -6,11 +7,10 @@ from pathlib import Path
 import inquirer
 from rich.console import Console
 from rich.progress import Progress
-from sqlalchemy.sql import text
 from dotenv import load_dotenv
 
-from src.db_utils import get_db_engine, check_db_connection_with_friendly_error
-from src.search_utils import search_users, search_orders, search_coupons, search_regular_posts, get_engine, table_prefix
+from src.db_utils import check_db_connection_with_friendly_error
+from src.search_utils import search_users, search_orders, search_coupons, search_regular_posts, get_engine, search_text, table_prefix
 
 console = Console()
 load_dotenv(override=True)
@@ -20,6 +20,9 @@ BATCH_SIZE = 1000
 EXPORTS_DIR = Path("exports")
 EXPORTS_DIR.mkdir(exist_ok=True)
 
+# Characters that are not allowed in identifier-style CSV headers
+INVALID_IDENTIFIER_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
 def _get_csv_export_options():
     """Prompt user for CSV export options"""
     # First get the basic options
@@ -116,8 +119,7 @@ def _transform_header(header, style, ensure_valid_identifiers=False):
         if not transformed or not (transformed[0].isalpha() or transformed[0] == '_'):
             transformed = 'a_' + transformed
         # Also replace any invalid characters with underscores
-        import re
-        transformed = re.sub(r'[^a-zA-Z0-9_]', '_', transformed)
+        transformed = INVALID_IDENTIFIER_CHARS.sub('_', transformed)
     
     return transformed
 
@@ -164,131 +166,21 @@ def export_users():
         
         if export_format == "JSON":
             filepath = exports_dir / f"users_{timestamp}.json"
-            export_func = _export_batch_to_json
         else:  # CSV
             filepath = exports_dir / f"users_{timestamp}.csv"
-            export_func = _export_batch_to_csv
             
-        engine = get_db_engine()
-        
         # If we need to export meta keys, prepare the query
         meta_table = meta_info.get("meta_table")
         users_table = meta_info["table"]
         
-        # Initialize the export file
-        if export_format == "CSV":
-            # For CSV, we need to write the header first
-            with get_engine().connect() as connection:
-                # Get base column names 
-                limit_query = f"{query} LIMIT 1"
-                header_result = connection.execute(text(limit_query), params)
-                base_columns = header_result.keys()
-                
-                # Create header with base columns + selected meta keys
-                all_columns = list(base_columns) + export_meta_keys
-                
-                # Transform headers based on selected style
-                if csv_options:
-                    all_columns = [_transform_header(
-                        col, 
-                        csv_options["headings"],
-                        csv_options.get("ensure_valid_identifiers", False)
-                    ) for col in all_columns]
-                
-                with open(filepath, 'w', newline='', encoding=csv_options["encoding"] if csv_options else 'utf-8') as f:
-                    writer = csv.writer(f, delimiter=csv_options["separator"] if csv_options else ',')
-                    writer.writerow(all_columns)
-        else:
-            # For JSON, just create an empty file with array brackets
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("[\n")
-                
-        # Export in batches with progress tracking
+        # Stream the rows into the export file with progress tracking
         with Progress() as progress:
             task = progress.add_task("[green]Exporting users...", total=count)
-            
-            offset = 0
-            records_exported = 0
-            first_batch = True
-            
-            # Add pagination to the query
-            paginated_query = f"{query} LIMIT :batch_size OFFSET :offset"
-            
-            while records_exported < count:
-                with get_engine().connect() as connection:
-                    # Execute query with pagination
-                    batch_result = connection.execute(
-                        text(paginated_query),
-                        {**params, "batch_size": batch_size, "offset": offset}
-                    )
-                    
-                    # Get batch data
-                    rows = batch_result.fetchall()
-                    if not rows:
-                        break
-                    
-                    batch_size_actual = len(rows)
-                    
-                    # Convert to list of dicts for base data
-                    column_names = batch_result.keys()
-                    batch_data = [dict(zip(column_names, row)) for row in rows]
-                    
-                    # If we have meta keys to export, fetch them
-                    if export_meta_keys:
-                        user_ids = [row['ID'] for row in batch_data]
-                        placeholders = ', '.join([':id' + str(i) for i in range(len(user_ids))])
-                        meta_key_placeholders = ', '.join([':meta' + str(i) for i in range(len(export_meta_keys))])
-                        
-                        # Create a query to get all selected meta data for these users
-                        meta_query = f"""
-                            SELECT user_id, meta_key, meta_value 
-                            FROM `{meta_table}` 
-                            WHERE user_id IN ({placeholders})
-                            AND meta_key IN ({meta_key_placeholders})
-                        """
-                        
-                        # Prepare parameters for the meta query
-                        meta_params = {}
-                        for i, user_id in enumerate(user_ids):
-                            meta_params[f'id{i}'] = user_id
-                        
-                        for i, meta_key in enumerate(export_meta_keys):
-                            meta_params[f'meta{i}'] = meta_key
-                            
-                        # Execute meta query
-                        meta_result = connection.execute(text(meta_query), meta_params)
-                        meta_rows = meta_result.fetchall()
-                        
-                        # Organize meta data by user_id and meta_key
-                        user_meta_data = {}
-                        for meta_row in meta_rows:
-                            user_id = meta_row[0]
-                            meta_key = meta_row[1]
-                            meta_value = meta_row[2]
-                            
-                            if user_id not in user_meta_data:
-                                user_meta_data[user_id] = {}
-                                
-                            user_meta_data[user_id][meta_key] = meta_value
-                        
-                        # Add meta data to batch data
-                        for record in batch_data:
-                            user_id = record['ID']
-                            if user_id in user_meta_data:
-                                for meta_key in export_meta_keys:
-                                    record[meta_key] = user_meta_data[user_id].get(meta_key, None)
-                            else:
-                                for meta_key in export_meta_keys:
-                                    record[meta_key] = None
-                    
-                    # Export this batch
-                    export_func(batch_data, filepath, first_batch, records_exported + batch_size_actual >= count, csv_options)
-                    
-                    # Update progress
-                    progress.update(task, advance=batch_size_actual)
-                    records_exported += batch_size_actual
-                    offset += batch_size
-                    first_batch = False
+            records_exported = _stream_export(
+                query, params, meta_table, "user_id", export_meta_keys,
+                filepath, export_format, csv_options, progress, task,
+                meta_info.get("prefetched_rows")
+            )
                     
         console.print(f"✅ Successfully exported {records_exported} users to {filepath}", style="bold green")
                 
@@ -356,129 +248,21 @@ def export_posts(post_type, display_name=None):
         
         if export_format == "JSON":
             filepath = exports_dir / f"{post_type}_{timestamp}.json"
-            export_func = _export_batch_to_json
         else:  # CSV
             filepath = exports_dir / f"{post_type}_{timestamp}.csv"
-            export_func = _export_batch_to_csv
         
         # If we need to export meta keys, prepare the query
         meta_table = meta_info.get("meta_table")
         posts_table = meta_info["table"]
         
-        # Initialize the export file
-        if export_format == "CSV":
-            # For CSV, we need to write the header first
-            with get_engine().connect() as connection:
-                # Get base column names 
-                limit_query = f"{query} LIMIT 1"
-                header_result = connection.execute(text(limit_query), params)
-                base_columns = header_result.keys()
-                
-                # Create header with base columns + selected meta keys
-                all_columns = list(base_columns) + export_meta_keys
-                
-                # Transform headers based on selected style
-                if csv_options:
-                    all_columns = [_transform_header(
-                        col, 
-                        csv_options["headings"],
-                        csv_options.get("ensure_valid_identifiers", False)
-                    ) for col in all_columns]
-                
-                with open(filepath, 'w', newline='', encoding=csv_options["encoding"] if csv_options else 'utf-8') as f:
-                    writer = csv.writer(f, delimiter=csv_options["separator"] if csv_options else ',')
-                    writer.writerow(all_columns)
-        else:
-            # For JSON, just create an empty file with array brackets
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("[\n")
-                
-        # Export in batches with progress tracking
+        # Stream the rows into the export file with progress tracking
         with Progress() as progress:
             task = progress.add_task(f"[green]Exporting {display_name.lower()}s...", total=count)
-            
-            offset = 0
-            records_exported = 0
-            first_batch = True
-            
-            # Add pagination to the query
-            paginated_query = f"{query} LIMIT :batch_size OFFSET :offset"
-            
-            while records_exported < count:
-                with get_engine().connect() as connection:
-                    # Execute query with pagination
-                    batch_result = connection.execute(
-                        text(paginated_query),
-                        {**params, "batch_size": batch_size, "offset": offset}
-                    )
-                    
-                    # Get batch data
-                    rows = batch_result.fetchall()
-                    if not rows:
-                        break
-                    
-                    batch_size_actual = len(rows)
-                    
-                    # Convert to list of dicts for base data
-                    column_names = batch_result.keys()
-                    batch_data = [dict(zip(column_names, row)) for row in rows]
-                    
-                    # If we have meta keys to export, fetch them
-                    if export_meta_keys:
-                        post_ids = [row['ID'] for row in batch_data]
-                        placeholders = ', '.join([':id' + str(i) for i in range(len(post_ids))])
-                        meta_key_placeholders = ', '.join([':meta' + str(i) for i in range(len(export_meta_keys))])
-                        
-                        # Create a query to get all selected meta data for these posts
-                        meta_query = f"""
-                            SELECT post_id, meta_key, meta_value 
-                            FROM `{meta_table}` 
-                            WHERE post_id IN ({placeholders})
-                            AND meta_key IN ({meta_key_placeholders})
-                        """
-                        
-                        # Prepare parameters for the meta query
-                        meta_params = {}
-                        for i, post_id in enumerate(post_ids):
-                            meta_params[f'id{i}'] = post_id
-                        
-                        for i, meta_key in enumerate(export_meta_keys):
-                            meta_params[f'meta{i}'] = meta_key
-                            
-                        # Execute meta query
-                        meta_result = connection.execute(text(meta_query), meta_params)
-                        meta_rows = meta_result.fetchall()
-                        
-                        # Organize meta data by post_id and meta_key
-                        post_meta_data = {}
-                        for meta_row in meta_rows:
-                            post_id = meta_row[0]
-                            meta_key = meta_row[1]
-                            meta_value = meta_row[2]
-                            
-                            if post_id not in post_meta_data:
-                                post_meta_data[post_id] = {}
-                                
-                            post_meta_data[post_id][meta_key] = meta_value
-                        
-                        # Add meta data to batch data
-                        for record in batch_data:
-                            post_id = record['ID']
-                            if post_id in post_meta_data:
-                                for meta_key in export_meta_keys:
-                                    record[meta_key] = post_meta_data[post_id].get(meta_key, None)
-                            else:
-                                for meta_key in export_meta_keys:
-                                    record[meta_key] = None
-                    
-                    # Export this batch
-                    export_func(batch_data, filepath, first_batch, records_exported + batch_size_actual >= count, csv_options)
-                    
-                    # Update progress
-                    progress.update(task, advance=batch_size_actual)
-                    records_exported += batch_size_actual
-                    offset += batch_size
-                    first_batch = False
+            records_exported = _stream_export(
+                query, params, meta_table, "post_id", export_meta_keys,
+                filepath, export_format, csv_options, progress, task,
+                meta_info.get("prefetched_rows")
+            )
                     
         console.print(f"✅ Successfully exported {records_exported} {display_name.lower()}s to {filepath}", style="bold green")
                 
@@ -514,7 +298,107 @@ def export_custom_post_type():
     # Use the generic export_posts function with the selected post type
     export_posts(post_type=selected_type)
 
-def _export_batch_to_json(data, filepath, is_first_batch, is_last_batch):
+def _stream_export(query, params, meta_table, meta_id_column, export_meta_keys, filepath, export_format, csv_options, progress, task,
+                   prefetched_rows=None):
+    """
+    Stream the rows of an export query into the export file in batches of BATCH_SIZE.
+    The query runs once on a server-side cursor; the selected meta data for each batch
+    is read on a second connection while the cursor is still open. Rows the search
+    already read, given as (column names, rows), are written without running the query.
+    Returns the number of records exported.
+    """
+    records_exported = 0
+    
+    with get_engine().connect() as connection, get_engine().connect() as meta_connection:
+        if prefetched_rows is not None:
+            column_names, all_rows = prefetched_rows
+            partitions = (all_rows[i:i + BATCH_SIZE] for i in range(0, len(all_rows), BATCH_SIZE))
+        else:
+            result = connection.execute(
+                search_text(query, params), params, execution_options={"yield_per": BATCH_SIZE}
+            )
+            column_names = list(result.keys())
+            partitions = result.partitions()
+        
+        # Initialize the export file
+        if export_format == "CSV":
+            # For CSV, write the header with base columns + selected meta keys
+            all_columns = column_names + export_meta_keys
+            
+            # Transform headers based on selected style
+            if csv_options:
+                all_columns = [_transform_header(
+                    col, 
+                    csv_options["headings"],
+                    csv_options.get("ensure_valid_identifiers", False)
+                ) for col in all_columns]
+            
+            with open(filepath, 'w', newline='', encoding=csv_options["encoding"] if csv_options else 'utf-8') as f:
+                writer = csv.writer(f, delimiter=csv_options["separator"] if csv_options else ',')
+                writer.writerow(all_columns)
+            export_func = _export_batch_to_csv
+        else:
+            # For JSON, just create an empty file with array brackets
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write("[\n")
+            export_func = _export_batch_to_json
+        
+        # Look one batch ahead so the last batch is known when it is written
+        rows = next(partitions, None)
+        first_batch = True
+        
+        while rows is not None:
+            next_rows = next(partitions, None)
+            
+            # Convert to list of dicts for base data
+            batch_data = [dict(zip(column_names, row)) for row in rows]
+            
+            # If we have meta keys to export, fetch them
+            if export_meta_keys:
+                # Create a query to get all selected meta data for these items,
+                # with the lists bound as expanding parameters so every batch reuses one statement
+                meta_query = f"""
+                    SELECT {meta_id_column}, meta_key, meta_value 
+                    FROM `{meta_table}` 
+                    WHERE {meta_id_column} IN :ids
+                    AND meta_key IN :meta_keys
+                """
+                meta_params = {
+                    "ids": [record['ID'] for record in batch_data],
+                    "meta_keys": list(export_meta_keys),
+                }
+                    
+                # Execute meta query
+                meta_result = meta_connection.execute(search_text(meta_query, meta_params), meta_params)
+                
+                # Organize meta data by item ID and meta_key
+                item_meta_data = {}
+                for item_id, meta_key, meta_value in meta_result:
+                    item_meta_data.setdefault(item_id, {})[meta_key] = meta_value
+                
+                # Add meta data to batch data
+                for record in batch_data:
+                    meta_values = item_meta_data.get(record['ID'], {})
+                    for meta_key in export_meta_keys:
+                        record[meta_key] = meta_values.get(meta_key, None)
+            
+            # Export this batch
+            export_func(batch_data, filepath, first_batch, next_rows is None, csv_options)
+            
+            # Update progress
+            progress.update(task, advance=len(rows))
+            records_exported += len(rows)
+            first_batch = False
+            rows = next_rows
+    
+    # Close the JSON array when no batch was written
+    if export_format == "JSON" and first_batch:
+        with open(filepath, 'a', encoding='utf-8') as f:
+            f.write("]")
+    
+    return records_exported
+
+def _export_batch_to_json(data, filepath, is_first_batch, is_last_batch, csv_options=None):
     """Export a batch of data to a JSON file with appropriate formatting"""
     try:
         # Process data for JSON serialization
@@ -2,6 +2,8 @@ import os
 import json
 import re
 import datetime
+import functools
+import concurrent.futures
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 import inquirer
@@ -9,7 +11,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 from sqlalchemy import inspect
-from sqlalchemy.sql import text
+from sqlalchemy.sql import text, bindparam
 from dotenv import load_dotenv
 
 try:
@@ -18,6 +20,12 @@ try:
 except ImportError:
     PHPSERIALIZE_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.db_utils import get_db_engine, get_db_inspector, check_db_connection_with_friendly_error
 
 console = Console()
@@ -46,10 +54,95 @@ def get_inspector():
         inspector = get_db_inspector()
     return inspector
 
+@functools.lru_cache(maxsize=None)
+def _get_table_columns(table_name: str) -> Tuple[Dict[str, Any], ...]:
+    """Get column information for a table, cached for the rest of the session"""
+    return tuple(get_inspector().get_columns(table_name))
+
+def _get_primary_key_column(table_name: str) -> str:
+    """Get the primary key column of a table (assumed to be the first column)"""
+    return _get_table_columns(table_name)[0]['name']
+
+@functools.lru_cache(maxsize=None)
+def _get_text_columns(table_name: str) -> Tuple[str, ...]:
+    """Get the names of the columns of a table that are likely to contain text"""
+    text_columns = []
+    for col in _get_table_columns(table_name):
+        try:
+            # Check if column type is likely to contain text
+            if _TEXT_COLUMN_TYPE.search(str(col['type'])):
+                text_columns.append(col['name'])
+            elif hasattr(col['type'], 'python_type'):
+                if col['type'].python_type in (str, type(None)):
+                    text_columns.append(col['name'])
+        except Exception:
+            # If we can't determine the type, include it anyway for text search
+            console.print(f"  ⚠️  Could not determine type for column {col['name']} in {table_name}, including anyway", style="dim")
+            text_columns.append(col['name'])
+
+    return tuple(text_columns)
+
+def clear_schema_cache():
+    """Forget cached column information so it is re-read from the database"""
+    _get_table_columns.cache_clear()
+    _get_text_columns.cache_clear()
+
 # Create backups directory
 BACKUPS_DIR = Path("backups")
 BACKUPS_DIR.mkdir(exist_ok=True)
 
+# Number of rows fetched and updated per round-trip during replace
+REPLACE_BATCH_SIZE = 500
+
+# Maximum number of tables searched concurrently when finding matches
+SEARCH_MAX_WORKERS = 8
+
+# Maximum number of tables whose rows are fetched and rewritten concurrently during replace
+REPLACE_MAX_WORKERS = 8
+
+# Longest value whose replacement result is cached. Short option and meta values repeat;
+# longer ones (such as post content) are rarely duplicated and would only pin memory
+REPLACE_CACHE_MAX_VALUE_LENGTH = 4 * 1024
+
+# Leading structure of PHP serialized values (scalars are matched whole) and the character
+# each type marker ends with
+_PHP_SERIALIZED_PREFIX = re.compile(
+    r'a:\d+:\{|O:\d+:"|s:\d+:"'
+    r'|(?:i:-?\d+|b:[01]|d:(?:-?\d+(?:\.\d+)?(?:E[+-]?\d+)?|-?INF|NAN)|N);\Z'
+)
+_PHP_SERIALIZED_ENDINGS = {
+    'a': '}',  # array
+    'O': '}',  # object
+    's': ';',  # string
+    'i': ';',  # integer
+    'b': ';',  # boolean
+    'd': ';',  # double
+    'N': ';',  # null
+}
+
+# Header of a serialized string element and the "; that closes its content. WordPress
+# strings may contain unescaped "; so there the end must be followed by the start of
+# the next element, the end of an array/object or the end of the data.
+_PHP_STRING_HEADER = re.compile(rb's:\d+:"')
+_PHP_STRING_END = re.compile(rb'";(?=[s:aiboN}]|\Z)')
+_PHP_STRING_END_WORDPRESS = re.compile(rb'";(?=s:|i:|b:|d:|a:|O:|N;|\}|\Z)')
+
+# Column types that are likely to contain text (CHAR, VARCHAR, TEXT, LONGTEXT, ...)
+_TEXT_COLUMN_TYPE = re.compile(r'CHAR|TEXT', re.IGNORECASE)
+
+# Escape character for literal % and _ in "contains" LIKE patterns
+LIKE_ESCAPE_CHAR = "!"
+
+# Characters a JSON document can start with
+_JSON_STARTS = frozenset('{["-0123456789tfn')
+
+# Character that must close a JSON object, array or string document
+_JSON_ENDINGS = {
+    '{': '}',
+    '[': ']',
+    '"': '"',
+}
+
 class SearchReplaceSession:
     """Manages a search and replace session with undo capabilities"""
 
@@ -62,25 +155,47 @@ class SearchReplaceSession:
         self.selected_rows = {}   # table_name: [row_ids to modify]
         self.filters = {}  # table_name: {"column": "column_name", "value": "filter_value"}
         self.backup_file = None
+        self.changes_file = None
         self.changes_made = []
         
     def create_backup_file(self):
-        """Create a backup file for this session"""
+        """
+        Create a backup file for this session.
+        The backup file only holds the session details; the changes themselves are
+        appended one JSON object per line to a separate changes file as they are made.
+        """
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.backup_file = BACKUPS_DIR / f"search_replace_backup_{timestamp}.json"
+        self.changes_file = BACKUPS_DIR / f"search_replace_backup_{timestamp}.changes.jsonl"
         
         backup_data = {
             "timestamp": timestamp,
             "search_term": self.search_term,
             "replace_term": self.replace_term,
-            "changes": []
+            "changes_file": self.changes_file.name
         }
         
         with open(self.backup_file, 'w') as f:
             json.dump(backup_data, f, indent=2)
+
+        # Start with an empty changes file
+        open(self.changes_file, 'w').close()
             
         return self.backup_file
 
+    def append_backup_changes(self, changes: List[Dict[str, Any]]):
+        """Append changes to the changes file without rewriting what is already there"""
+        if not self.changes_file or not changes:
+            return
+
+        with open(self.changes_file, 'a', encoding='utf-8') as f:
+            f.writelines(_json_dumps(change) + '\n' for change in changes)
+
+    def clear_backup_changes(self):
+        """Empty the changes file, e.g. after the changes were rolled back"""
+        if self.changes_file:
+            open(self.changes_file, 'w').close()
+
 def search_and_replace_menu():
     """Main search and replace menu function"""
     console.print("\n🔄 Search and Replace Tool", style="bold blue")
@@ -264,6 +379,9 @@ def _select_tables(session: SearchReplaceSession):
         session.filtered_results = {}
         session.selected_rows = {}
         session.filters = {}
+
+        # Re-read column information in case the schema changed since it was cached
+        clear_schema_cache()
         
         console.print(f"✅ Selected {len(session.selected_tables)} tables", style="bold green")
         
@@ -286,51 +404,42 @@ def _find_matches(session: SearchReplaceSession):
     total_matches = 0
     
     try:
-        with get_engine().connect() as connection:
+        # Columns are read and queries built here, then the tables are queried concurrently,
+        # each on its own connection; the output is still printed in table order.
+        # The engine is created here so the workers don't race to initialise it.
+        engine = get_engine()
+        max_workers = max(1, min(SEARCH_MAX_WORKERS, len(session.selected_tables)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            table_searches = []
             for table_name in session.selected_tables:
                 try:
-                    console.print(f"Searching {table_name}...", style="dim")
-
                     # Get table columns with better error handling
                     try:
-                        columns = get_inspector().get_columns(table_name)
+                        columns = _get_table_columns(table_name)
                     except Exception as col_error:
-                        console.print(f"  ⚠️  Could not get columns for {table_name}: {col_error}", style="yellow")
+                        table_searches.append((table_name, (f"  ⚠️  Could not get columns for {table_name}: {col_error}", "yellow"), None))
                         continue
 
                     if not columns:
-                        console.print(f"  ⚠️  No columns found in {table_name}", style="yellow")
+                        table_searches.append((table_name, (f"  ⚠️  No columns found in {table_name}", "yellow"), None))
                         continue
 
                     # Find text columns with safer type checking
-                    text_columns = []
-                    for col in columns:
-                        try:
-                            # Check if column type is likely to contain text
-                            col_type_str = str(col['type']).upper()
-                            if any(text_type in col_type_str for text_type in ['TEXT', 'VARCHAR', 'CHAR', 'LONGTEXT', 'MEDIUMTEXT', 'TINYTEXT']):
-                                text_columns.append(col['name'])
-                            elif hasattr(col['type'], 'python_type'):
-                                if col['type'].python_type in (str, type(None)):
-                                    text_columns.append(col['name'])
-                        except Exception as type_error:
-                            # If we can't determine the type, include it anyway for text search
-                            console.print(f"  ⚠️  Could not determine type for column {col['name']} in {table_name}, including anyway", style="dim")
-                            text_columns.append(col['name'])
+                    text_columns = _get_text_columns(table_name)
 
                     if not text_columns:
-                        console.print(f"  ⚪ No text columns found in {table_name}", style="dim")
+                        table_searches.append((table_name, (f"  ⚪ No text columns found in {table_name}", "dim"), None))
                         continue
 
                     # Build search query for text columns
                     where_conditions = []
                     for col in text_columns:
-                        where_conditions.append(f"`{col}` LIKE :search_term")
+                        where_conditions.append(f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'")
 
                     search_where_clause = " OR ".join(where_conditions)
 
                     # Add filter conditions if filters exist for this table
-                    query_params = {"search_term": f"%{session.search_term}%"}
+                    query_params = {"search_term": _contains_pattern(session.search_term)}
                     final_where_clause = search_where_clause
 
                     if table_name in session.filters:
@@ -343,27 +452,37 @@ def _find_matches(session: SearchReplaceSession):
                             filter_condition = f"`{filter_column}` = :filter_value"
                             query_params["filter_value"] = filter_value
                         else:  # Contains match
-                            filter_condition = f"`{filter_column}` LIKE :filter_value"
-                            query_params["filter_value"] = f"%{filter_value}%"
+                            filter_condition = f"`{filter_column}` LIKE :filter_value ESCAPE '{LIKE_ESCAPE_CHAR}'"
+                            query_params["filter_value"] = _contains_pattern(filter_value)
 
                         final_where_clause = f"({search_where_clause}) AND ({filter_condition})"
 
                     # Execute search query
                     query = text(f"SELECT * FROM `{table_name}` WHERE {final_where_clause}")
-                    result = connection.execute(query, query_params)
+                    table_searches.append((table_name, None, executor.submit(_fetch_matching_rows, engine, query, query_params)))
 
-                    rows = result.fetchall()
-                    if rows:
-                        session.search_results[table_name] = rows
-                        total_matches += len(rows)
-                        console.print(f"  ✅ Found {len(rows)} matches in {table_name}", style="green")
-                    else:
-                        console.print(f"  ⚪ No matches in {table_name}", style="dim")
+                except Exception as table_error:
+                    table_searches.append((table_name, (f"  ❌ Error searching table {table_name}: {table_error}", "red"), None))
+
+            for table_name, message, future in table_searches:
+                console.print(f"Searching {table_name}...", style="dim")
+                if future is None:
+                    console.print(message[0], style=message[1])
+                    continue
 
+                try:
+                    rows = future.result()
                 except Exception as table_error:
                     console.print(f"  ❌ Error searching table {table_name}: {table_error}", style="red")
                     continue
 
+                if rows:
+                    session.search_results[table_name] = rows
+                    total_matches += len(rows)
+                    console.print(f"  ✅ Found {len(rows)} matches in {table_name}", style="green")
+                else:
+                    console.print(f"  ⚪ No matches in {table_name}", style="dim")
+
         console.print(f"\n📊 Search Complete: {total_matches} total matches found across {len(session.search_results)} tables", style="bold green")
 
         # Show filter information if filters were applied during search
@@ -379,7 +498,7 @@ def _find_matches(session: SearchReplaceSession):
         for table_name, rows in results_for_selection.items():
             try:
                 # Assume first column is the primary key
-                columns = get_inspector().get_columns(table_name)
+                columns = _get_table_columns(table_name)
                 if columns:
                     pk_column = columns[0]['name']  # Usually 'id'
                     session.selected_rows[table_name] = [getattr(row, pk_column) for row in rows]
@@ -515,7 +634,7 @@ def _configure_column_value_filter(session: SearchReplaceSession):
 
     # Get column information for the selected table
     try:
-        columns_info = get_inspector().get_columns(table_name)
+        columns_info = _get_table_columns(table_name)
         column_names = [col['name'] for col in columns_info]
 
         # Include all columns (including ID/primary key)
@@ -636,7 +755,7 @@ def _view_table_data(session: SearchReplaceSession):
 
     try:
         # Get all column information
-        columns_info = get_inspector().get_columns(table_name)
+        columns_info = _get_table_columns(table_name)
         all_columns = [col['name'] for col in columns_info]
 
         if not all_columns:
@@ -986,8 +1105,7 @@ def _create_highlighted_snippet(value: str, search_term: str, max_length: int =
 def _deselect_specific_rows(session: SearchReplaceSession, table_name: str, rows: List):
     """Allow user to deselect specific rows"""
     # Get primary key column
-    columns = get_inspector().get_columns(table_name)
-    pk_column = columns[0]['name']
+    pk_column = _get_primary_key_column(table_name)
 
     # Create choices for row selection
     choices = []
@@ -1027,8 +1145,7 @@ def _deselect_specific_rows(session: SearchReplaceSession, table_name: str, rows
 def _select_only_specific_rows(session: SearchReplaceSession, table_name: str, rows: List):
     """Allow user to select only specific rows"""
     # Get primary key column
-    columns = get_inspector().get_columns(table_name)
-    pk_column = columns[0]['name']
+    pk_column = _get_primary_key_column(table_name)
 
     # Create choices for row selection
     choices = []
@@ -1063,15 +1180,29 @@ def _select_only_specific_rows(session: SearchReplaceSession, table_name: str, r
     session.selected_rows[table_name] = selected_ids
     console.print(f"✅ {len(selected_ids)} rows selected for modification.", style="green")
 
+def _contains_pattern(search_term: str) -> str:
+    """LIKE pattern matching search_term anywhere, with its own % and _ taken literally"""
+    for char in (LIKE_ESCAPE_CHAR, "%", "_"):
+        search_term = search_term.replace(char, LIKE_ESCAPE_CHAR + char)
+    return f"%{search_term}%"
+
+def _fetch_matching_rows(engine, query, query_params):
+    """Run a table's search query on its own connection and return all matching rows"""
+    with engine.connect() as connection:
+        return connection.execute(query, query_params).fetchall()
+
 def _create_row_summary(row, search_term: str) -> str:
     """Create a summary of a row for display purposes"""
-    # Get all column values and find those containing the search term
+    # Get the column values containing the search term, up to the 3 that are shown
+    term = search_term.lower()
     matching_parts = []
     for key, value in row._mapping.items():
-        if value and search_term.lower() in str(value).lower():
+        if not value:
+            continue
+        value_str = str(value)
+        search_pos = value_str.lower().find(term)
+        if search_pos >= 0:
             # Get a snippet around the search term
-            value_str = str(value)
-            search_pos = value_str.lower().find(search_term.lower())
             start = max(0, search_pos - 15)
             end = min(len(value_str), search_pos + len(search_term) + 15)
             snippet = value_str[start:end]
@@ -1082,8 +1213,10 @@ def _create_row_summary(row, search_term: str) -> str:
             # Clean up snippet for display
             snippet = snippet.replace('\n', ' ').replace('\r', ' ')
             matching_parts.append(f"{key}: {snippet}")
+            if len(matching_parts) == 3:
+                break
 
-    return " | ".join(matching_parts[:3])  # Show first 3 matching parts
+    return " | ".join(matching_parts)
 
 def _get_replace_term(session: SearchReplaceSession) -> bool:
     """Get the replacement text from user"""
@@ -1177,6 +1310,22 @@ def _execute_replace(session: SearchReplaceSession, dry_run: bool = True):
         session.create_backup_file()
         console.print(f"📁 Backup file created: {session.backup_file}", style="green")
 
+    # Resolve table columns up front so the workers below only talk to the database
+    tables_to_process = []
+    for table_name, row_ids in session.selected_rows.items():
+        if not row_ids:
+            continue
+
+        # Get table columns with better error handling
+        try:
+            columns = _get_table_columns(table_name)
+            text_columns = _get_text_columns(table_name) if columns else ()
+            column_error = None
+        except Exception as e:
+            columns, text_columns, column_error = (), (), e
+
+        tables_to_process.append((table_name, row_ids, columns, text_columns, column_error))
+
     # Execute the replacement
     try:
         with get_engine().connect() as connection:
@@ -1185,99 +1334,49 @@ def _execute_replace(session: SearchReplaceSession, dry_run: bool = True):
             try:
                 changes_made = []
 
-                for table_name, row_ids in session.selected_rows.items():
-                    if not row_ids:
-                        continue
-
-                    console.print(f"\n{'[DRY RUN] ' if dry_run else ''}Processing table: {table_name}", style="bold")
-
-                    # Get table columns with better error handling
-                    try:
-                        columns = get_inspector().get_columns(table_name)
+                # Tables are independent, so their rows are fetched and rewritten concurrently
+                # on separate connections. Updates are applied here, in table order, inside the
+                # one transaction so the whole operation still commits or rolls back together.
+                max_workers = max(1, min(REPLACE_MAX_WORKERS, len(tables_to_process)))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        (table_name, columns, text_columns, column_error, executor.submit(
+                            _prepare_table_replace, session, table_name, row_ids, columns, text_columns, dry_run
+                        ))
+                        for table_name, row_ids, columns, text_columns, column_error in tables_to_process
+                    ]
+
+                    for table_name, columns, text_columns, column_error, future in futures:
+                        console.print(f"\n{'[DRY RUN] ' if dry_run else ''}Processing table: {table_name}", style="bold")
+
+                        if column_error is not None:
+                            console.print(f"  ❌ Error getting columns for {table_name}: {column_error}", style="red")
+                            continue
                         if not columns:
                             console.print(f"  ⚠️  No columns found in {table_name}, skipping", style="yellow")
                             continue
-                        pk_column = columns[0]['name']
-
-                        # Find text columns with safer type checking
-                        text_columns = []
-                        for col in columns:
-                            try:
-                                col_type_str = str(col['type']).upper()
-                                if any(text_type in col_type_str for text_type in ['TEXT', 'VARCHAR', 'CHAR', 'LONGTEXT', 'MEDIUMTEXT', 'TINYTEXT']):
-                                    text_columns.append(col['name'])
-                                elif hasattr(col['type'], 'python_type'):
-                                    if col['type'].python_type in (str, type(None)):
-                                        text_columns.append(col['name'])
-                            except Exception:
-                                # If we can't determine the type, include it anyway
-                                text_columns.append(col['name'])
-
-                    except Exception as col_error:
-                        console.print(f"  ❌ Error getting columns for {table_name}: {col_error}", style="red")
-                        continue
-
-                    for row_id in row_ids:
-                        # Get current row data
-                        select_query = text(f"SELECT * FROM `{table_name}` WHERE `{pk_column}` = :row_id")
-                        result = connection.execute(select_query, {"row_id": row_id})
-                        row = result.fetchone()
-
-                        if not row:
-                            console.print(f"  ⚠️  Row {row_id} not found, skipping", style="yellow")
+                        if not text_columns:
+                            console.print(f"  ⚪ No text columns found in {table_name}, skipping", style="dim")
                             continue
 
-                        # Process each text column
-                        updates = {}
-                        row_changes = []
-
-                        for col_name in text_columns:
-                            original_value = getattr(row, col_name)
-                            if original_value and session.search_term in str(original_value):
-                                # Handle serialized data safely
-                                new_value = _safe_replace_in_serialized_data(
-                                    str(original_value),
-                                    session.search_term,
-                                    session.replace_term
-                                )
-
-                                if new_value != original_value:
-                                    updates[col_name] = new_value
-                                    row_changes.append({
-                                        "table": table_name,
-                                        "row_id": row_id,
-                                        "column": col_name,
-                                        "original_value": original_value,
-                                        "new_value": new_value
-                                    })
-
-                        # Execute updates
-                        if updates and not dry_run:
-                            update_parts = [f"`{col}` = :{col}" for col in updates.keys()]
-                            update_query = text(f"UPDATE `{table_name}` SET {', '.join(update_parts)} WHERE `{pk_column}` = :row_id")
-
-                            params = updates.copy()
-                            params["row_id"] = row_id
-
-                            connection.execute(update_query, params)
-                            changes_made.extend(row_changes)
-
-                        if updates:
-                            console.print(f"  ✅ {'Would update' if dry_run else 'Updated'} row {row_id} ({len(updates)} columns)", style="green")
-                        else:
-                            console.print(f"  ⚪ No changes needed for row {row_id}", style="dim")
+                        pk_column = columns[0]['name']
 
-                if not dry_run:
-                    # Save changes to backup file
-                    if session.backup_file and changes_made:
-                        with open(session.backup_file, 'r') as f:
-                            backup_data = json.load(f)
+                        for messages, update_batches, batch_changes in future.result():
+                            for message, style in messages:
+                                console.print(message, style=style)
 
-                        backup_data["changes"] = changes_made
+                            # Record the changes in the backup before executing them,
+                            # then execute updates, one statement per column set
+                            if update_batches and not dry_run:
+                                session.append_backup_changes(batch_changes)
+                                changes_made.extend(batch_changes)
 
-                        with open(session.backup_file, 'w') as f:
-                            json.dump(backup_data, f, indent=2)
+                                for update_columns, params_list in update_batches.items():
+                                    update_parts = [f"`{col}` = :{col}" for col in update_columns]
+                                    update_query = text(f"UPDATE `{table_name}` SET {', '.join(update_parts)} WHERE `{pk_column}` = :row_id")
+                                    connection.execute(update_query, params_list)
 
+                if not dry_run:
                     transaction.commit()
                     console.print(f"\n✅ Search and replace completed! {len(changes_made)} changes made.", style="bold green")
                     session.changes_made = changes_made
@@ -1287,178 +1386,340 @@ def _execute_replace(session: SearchReplaceSession, dry_run: bool = True):
 
             except Exception as e:
                 transaction.rollback()
+                if not dry_run:
+                    # Nothing was applied, so there is nothing to undo
+                    session.clear_backup_changes()
                 raise e
 
     except Exception as e:
         console.print(f"❌ Error during {'dry run' if dry_run else 'replacement'}: {e}", style="bold red")
+    finally:
+        # Cached values are specific to this run's terms, so don't keep them around
+        _replace_by_kind.cache_clear()
+
+def _prepare_table_replace(session: SearchReplaceSession, table_name: str, row_ids: List[Any],
+                           columns: Tuple[Dict[str, Any], ...], text_columns: Tuple[str, ...],
+                           dry_run: bool) -> List[Tuple[List[Tuple[str, str]], Dict[Tuple[str, ...], List[Dict[str, Any]]], List[Dict[str, Any]]]]:
+    """
+    Fetch the selected rows of a table on its own connection and work out their new values.
+    Returns one (messages, update_batches, changes) entry per batch of rows; nothing is printed
+    or written here so tables can be prepared concurrently.
+    """
+    if not columns or not text_columns:
+        return []
 
-def _safe_replace_in_serialized_data(original_value: str, search_term: str, replace_term: str) -> str:
-    """Safely replace text in potentially serialized data"""
+    pk_column = columns[0]['name']
+
+    # Fetch rows in batches with a single IN query instead of one SELECT per row.
+    # The same LIKE filter used by 'Find Matches' lets the database drop rows
+    # that no longer contain the search term before they are sent back, and
+    # only the primary key and text columns are transferred.
+    select_columns = [pk_column] + [col for col in text_columns if col != pk_column]
+    # Rows are read by position, which avoids a key lookup per column of every row
+    column_positions = [(col, select_columns.index(col)) for col in text_columns]
+    columns_sql = ", ".join(f"`{col}`" for col in select_columns)
+    match_clause = " OR ".join(f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'" for col in text_columns)
+    select_query = text(
+        f"SELECT {columns_sql} FROM `{table_name}` WHERE `{pk_column}` IN :row_ids AND ({match_clause})"
+    ).bindparams(bindparam("row_ids", expanding=True))
+    search_pattern = _contains_pattern(session.search_term)
+
+    # Kind of data ('php', 'json' or 'plain') last seen in each column
+    column_kinds = {}
+
+    # Binary values are matched against the encoded term, which only needs encoding once
+    search_bytes = session.search_term.encode('utf-8')
+
+    batches = []
+
+    with get_engine().connect() as connection:
+        for batch_start in range(0, len(row_ids), REPLACE_BATCH_SIZE):
+            batch_ids = row_ids[batch_start:batch_start + REPLACE_BATCH_SIZE]
+            result = connection.execute(select_query, {"row_ids": batch_ids, "search_term": search_pattern})
+            rows_by_id = {row[0]: row for row in result}
+
+            # Group update parameters by the columns they touch so each
+            # group can be sent as one executemany call
+            messages = []
+            update_batches = {}
+            batch_changes = []
+
+            for row_id in batch_ids:
+                row = rows_by_id.get(row_id)
+
+                if row is None:
+                    messages.append((f"  ⚪ Row {row_id} not found or no longer matches, skipping", "dim"))
+                    continue
+
+                # Process each text column
+                updates = {}
+                row_changes = []
+
+                for col_name, position in column_positions:
+                    original_value = row[position]
+                    if not original_value:
+                        continue
+
+                    value = _decode_cell(original_value, search_bytes)
+                    if value is not None and session.search_term in value:
+                        # Handle serialized data safely; warnings are printed by the main thread
+                        warnings = []
+                        new_value = _safe_replace_in_serialized_data(
+                            value,
+                            session.search_term,
+                            session.replace_term,
+                            column_kinds,
+                            col_name,
+                            warnings
+                        )
+                        messages.extend((f"  {warning} (row {row_id}, {col_name})", "yellow") for warning in warnings)
+
+                        if new_value != value:
+                            updates[col_name] = new_value
+                            row_changes.append({
+                                "table": table_name,
+                                "row_id": row_id,
+                                "column": col_name,
+                                "original_value": value,
+                                "new_value": new_value
+                            })
+
+                if updates:
+                    params = updates.copy()
+                    params["row_id"] = row_id
+                    update_batches.setdefault(tuple(updates.keys()), []).append(params)
+
+                    batch_changes.extend(row_changes)
+
+                    messages.append((f"  ✅ {'Would update' if dry_run else 'Updated'} row {row_id} ({len(updates)} columns)", "green"))
+                else:
+                    messages.append((f"  ⚪ No changes needed for row {row_id}", "dim"))
+
+            batches.append((messages, update_batches, batch_changes))
+
+    return batches
+
+def _decode_cell(value: Any, search_bytes: bytes) -> Optional[str]:
+    """
+    Get a column value as text, or None if it is binary data that can't contain the search term.
+    Text columns almost always come back as str already; binary values are checked for the
+    encoded term first, so values without a match are never decoded, and the others are
+    decoded as the UTF-8 text they hold instead of using their repr.
+    """
+    if type(value) is str:
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        if search_bytes not in value:
+            return None
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            # Not text, so there is nothing that can be safely replaced
+            return None
+    return str(value)
+
+def _safe_replace_in_serialized_data(original_value: str, search_term: str, replace_term: str,
+                                     column_kinds: Optional[Dict[str, str]] = None, column: Optional[str] = None,
+                                     warnings: Optional[List[str]] = None) -> str:
+    """
+    Safely replace text in potentially serialized data.
+
+    When column_kinds is given, the kind of data ('php', 'json' or 'plain') last seen in
+    the column is tried first, and the value is only classified again if it doesn't fit.
+    When warnings is given, warnings are added to it instead of being printed.
+    """
 
     # Handle None or empty values
     if not original_value:
         return original_value or ""
 
     # Convert to string if not already
-    original_value = str(original_value)
+    if type(original_value) is not str:
+        original_value = str(original_value)
+
+    # Nothing to replace, so there is no need to parse the value at all
+    if search_term not in original_value:
+        return original_value
+
+    # Columns usually hold one kind of data, so try the kind seen last time first
+    kind_hint = column_kinds.get(column) if column_kinds is not None else None
+
+    # WordPress tables repeat identical values, so small ones are only processed once
+    if len(original_value) <= REPLACE_CACHE_MAX_VALUE_LENGTH:
+        new_value, kind, value_warnings = _replace_by_kind(original_value, search_term, replace_term, kind_hint)
+    else:
+        new_value, kind, value_warnings = _replace_by_kind.__wrapped__(original_value, search_term, replace_term, kind_hint)
+
+    for warning in value_warnings:
+        _warn(warning, warnings)
 
-    # Check if this looks like PHP serialized data
-    if _is_php_serialized(original_value):
-        # Try phpserialize library first if available
-        if PHPSERIALIZE_AVAILABLE:
-            result = _replace_in_php_serialized_with_phpserialize(original_value, search_term, replace_term)
-            if result is not None:
-                return result
-            # If phpserialize fails, fall back to our custom approach
-            console.print("⚠️  phpserialize failed, falling back to custom parser", style="yellow")
+    if column_kinds is not None:
+        column_kinds[column] = kind
+    return new_value
 
-        return _replace_in_php_serialized(original_value, search_term, replace_term)
+@functools.lru_cache(maxsize=4096)
+def _replace_by_kind(value: str, search_term: str, replace_term: str, kind_hint: Optional[str]) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Replace text in a value with the handler for its kind, trying kind_hint first.
+    Returns the new value, the kind of data it was handled as and the warnings raised,
+    which are cached along with the result so repeated values report them too.
+    """
+    warnings = []
+    if kind_hint is not None:
+        new_value = _REPLACE_HANDLERS[kind_hint](value, search_term, replace_term, warnings)
+        if new_value is not None:
+            return new_value, kind_hint, tuple(warnings)
+
+    kind = _classify_serialized_value(value)
+    new_value = _REPLACE_HANDLERS[kind](value, search_term, replace_term, warnings)
+    if new_value is None:
+        # Looked like JSON but didn't parse, so do simple replacement
+        new_value = value.replace(search_term, replace_term)
+
+    return new_value, kind, tuple(warnings)
+
+def _warn(message: str, warnings: Optional[List[str]]):
+    """Add a warning to warnings, or print it when no list is collecting them"""
+    if warnings is not None:
+        warnings.append(message)
+    else:
+        console.print(message, style="yellow")
+
+def _classify_serialized_value(value: str) -> str:
+    """Classify a value as 'php' serialized, 'json' or 'plain' text from its leading characters"""
+    if _is_php_serialized(value):
+        return 'php'
+    if _looks_like_json(value):
+        return 'json'
+    return 'plain'
+
+def _replace_in_php_value(value: str, search_term: str, replace_term: str,
+                          warnings: Optional[List[str]] = None) -> Optional[str]:
+    """Replace text in PHP serialized data, or return None if the value isn't serialized"""
+    if not _is_php_serialized(value):
+        return None
+
+    # Try phpserialize library first if available
+    if PHPSERIALIZE_AVAILABLE:
+        result = _replace_in_php_serialized_with_phpserialize(value, search_term, replace_term, warnings)
+        if result is not None:
+            return result
+        # If phpserialize fails, fall back to our custom approach
+        _warn("⚠️  phpserialize failed, falling back to custom parser", warnings)
+
+    return _replace_in_php_serialized(value, search_term, replace_term, warnings)
+
+def _replace_in_json_value(value: str, search_term: str, replace_term: str,
+                           warnings: Optional[List[str]] = None) -> Optional[str]:
+    """Replace text in JSON data, or return None if the value isn't valid JSON"""
+    if not _looks_like_json(value):
+        return None
+
+    try:
+        data = _json_loads(value)
+    except (json.JSONDecodeError, ValueError):
+        return None
 
-    # Check if this looks like JSON
-    if _is_json_data(original_value):
-        return _replace_in_json_data(original_value, search_term, replace_term)
+    try:
+        modified_data = _replace_in_json_object(data, search_term, replace_term)
+        # Use compact separators to ensure single-line output without spaces
+        return _json_dumps(modified_data)
+    except Exception:
+        # If anything goes wrong, fall back to simple replacement
+        return value.replace(search_term, replace_term)
 
-    # For regular strings, do simple replacement
-    return original_value.replace(search_term, replace_term)
+def _replace_in_plain_value(value: str, search_term: str, replace_term: str,
+                            warnings: Optional[List[str]] = None) -> Optional[str]:
+    """Replace text in a plain value, or return None if it might be serialized or JSON"""
+    if _is_php_serialized(value) or _looks_like_json(value):
+        return None
+    return value.replace(search_term, replace_term)
 
 def _is_php_serialized(value: str) -> bool:
     """Check if a string looks like PHP serialized data"""
-    if not value:
+    # Most values are rejected by their first character before the regex runs
+    if not value or type(value) is not str or value[0] not in _PHP_SERIALIZED_ENDINGS:
         return False
 
-    # PHP serialized data patterns
-    patterns = [
-        r'^a:\d+:\{.*\}$',  # array
-        r'^s:\d+:".*";$',   # string
-        r'^i:\d+;$',        # integer
-        r'^b:[01];$',       # boolean
-        r'^O:\d+:".*":\d+:\{.*\}$',  # object
-    ]
-
-    for pattern in patterns:
-        if re.match(pattern, value, re.DOTALL):
-            return True
-
-    return False
+    # Serialized values are identified by their leading structure (such as a:2:{ or s:5:")
+    # and closing character, so there is no need to scan the whole (possibly huge) value
+    return (
+        _PHP_SERIALIZED_PREFIX.match(value) is not None
+        and value[-1] == _PHP_SERIALIZED_ENDINGS[value[0]]
+    )
 
 def _is_json_data(value: str) -> bool:
     """Check if a string looks like JSON data"""
-    if not value:
+    # Most text values can be rejected from their first character without parsing
+    if not _looks_like_json(value):
         return False
 
     try:
-        json.loads(value)
+        _json_loads(value)
         return True
     except (json.JSONDecodeError, ValueError):
         return False
 
-def _replace_in_php_serialized(serialized_data: str, search_term: str, replace_term: str) -> str:
+def _json_loads(value: str) -> Any:
+    """
+    Parse JSON data, using orjson when it is installed.
+    orjson is stricter (no NaN/Infinity, no integers over 64 bits), so such values
+    are treated as non-JSON and get a simple text replacement.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+def _json_dumps(data: Any) -> str:
+    """Serialize JSON data as compact single-line UTF-8 text, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        # orjson output is already compact and does not escape non-ASCII characters
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def _looks_like_json(value: str) -> bool:
+    """Check if a string starts (and for containers, ends) like a JSON document, without parsing it"""
+    value = value.strip()
+    first = value[:1]
+    if first not in _JSON_STARTS:
+        return False
+
+    # Text such as "[gallery] ..." starts like an array but can't be one unless it also closes
+    ending = _JSON_ENDINGS.get(first)
+    return ending is None or (len(value) > 1 and value[-1] == ending)
+
+def _replace_in_php_serialized(serialized_data: str, search_term: str, replace_term: str,
+                               warnings: Optional[List[str]] = None) -> str:
     """Safely replace text in PHP serialized data"""
     try:
         # For WordPress serialized data, we need to handle the fact that it may contain
         # unescaped quotes within string content. We'll use a more robust approach.
 
+        if search_term not in serialized_data:
+            return serialized_data
+
         # First, try simple replacement
         new_data = serialized_data.replace(search_term, replace_term)
 
-        # If the replacement changed the length of strings, we need to update the length indicators
-        if search_term != replace_term and len(search_term) != len(replace_term):
+        # If the replacement changed the byte length of strings, we need to update the length indicators
+        if _changes_byte_length(search_term, replace_term):
             new_data = _fix_php_serialized_lengths_wordpress(new_data)
 
         return new_data
 
     except Exception as e:
         # If anything goes wrong, return original data
-        console.print(f"⚠️  Warning: Could not safely replace in serialized data ({e}), skipping", style="yellow")
+        _warn(f"⚠️  Warning: Could not safely replace in serialized data ({e}), skipping", warnings)
         return serialized_data
 
+@functools.lru_cache(maxsize=16)
+def _changes_byte_length(search_term: str, replace_term: str) -> bool:
+    """Check if replacing search_term with replace_term changes the UTF-8 byte length of a string"""
+    return len(search_term.encode('utf-8')) != len(replace_term.encode('utf-8'))
+
 def _fix_php_serialized_lengths(serialized_data: str) -> str:
     """Fix string length indicators in PHP serialized data using proper parsing"""
-    result = []
-    i = 0
-
-    while i < len(serialized_data):
-        # Look for string pattern s:length:"
-        if serialized_data[i:i+2] == 's:':
-            # Find the length part
-            length_start = i + 2
-            length_end = serialized_data.find(':', length_start)
-
-            if length_end == -1:
-                # Not a valid string pattern, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            try:
-                declared_length = int(serialized_data[length_start:length_end])
-            except ValueError:
-                # Not a valid length, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Check if this is followed by a quote
-            quote_pos = length_end + 1
-            if quote_pos >= len(serialized_data) or serialized_data[quote_pos] != '"':
-                # Not a string pattern, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Find the actual end of the string content by looking for the pattern ";
-            # that appears after the content, but we need to be careful about quotes within the content
-            content_start = quote_pos + 1
-
-            # We need to find the actual end of the string content
-            # Since the length might be wrong due to replacements, we need to find the closing pattern
-            # Look for the next occurrence of "; that could be the end of this string
-            search_pos = content_start
-            content_end = -1
-
-            # Try to find the end by looking for "; patterns and validating them
-            while search_pos < len(serialized_data):
-                quote_pos_candidate = serialized_data.find('";', search_pos)
-                if quote_pos_candidate == -1:
-                    break
-
-                # Check if this could be a valid end by looking at what comes after
-                after_semicolon = quote_pos_candidate + 2
-                if after_semicolon >= len(serialized_data):
-                    # End of string, this must be it
-                    content_end = quote_pos_candidate
-                    break
-
-                next_char = serialized_data[after_semicolon]
-                # Valid characters that can follow a serialized string
-                if next_char in 's:aiboN}':  # start of next element or end of array/object
-                    content_end = quote_pos_candidate
-                    break
-
-                # Continue searching
-                search_pos = quote_pos_candidate + 1
-
-            if content_end == -1:
-                # Couldn't find a valid end, just copy the character and continue
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Extract the actual content
-            content = serialized_data[content_start:content_end]
-            actual_length = len(content)
-
-            # Rebuild the string with correct length
-            result.append(f's:{actual_length}:"{content}";')
-
-            # Move past this entire string
-            i = content_end + 2  # +2 for the "; at the end
-        else:
-            # Not a string pattern, just copy the character
-            result.append(serialized_data[i])
-            i += 1
-
-    return ''.join(result)
+    return _rebuild_php_string_lengths(serialized_data, _PHP_STRING_END)
 
 def _fix_php_serialized_lengths_wordpress(serialized_data: str) -> str:
     """
@@ -1466,122 +1727,122 @@ def _fix_php_serialized_lengths_wordpress(serialized_data: str) -> str:
     WordPress serialized data often contains unescaped quotes within strings,
     so we need a more robust approach.
     """
+    return _rebuild_php_string_lengths(serialized_data, _PHP_STRING_END_WORDPRESS)
+
+def _rebuild_php_string_lengths(serialized_data: str, end_pattern: re.Pattern) -> str:
+    """
+    Rewrite every s:length:"..."; element with the actual length of its content,
+    where end_pattern locates the "; that closes the content.
+
+    PHP counts string lengths in bytes, so the data is scanned as UTF-8 encoded
+    bytes and decoded once at the end. Both the header and the closing "; are
+    located by the regex engine, so the Python loop runs once per string element
+    rather than once per byte.
+    """
+    data = serialized_data.encode('utf-8')
     result = []
-    i = 0
+    last = 0
 
-    while i < len(serialized_data):
-        # Look for string pattern s:length:"
-        if i + 1 < len(serialized_data) and serialized_data[i:i+2] == 's:':
-            # Find the length part
-            length_start = i + 2
-            length_end = serialized_data.find(':', length_start)
+    header = _PHP_STRING_HEADER.search(data)
 
-            if length_end == -1:
-                # Not a valid string pattern, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
+    while header:
+        # The length might be wrong due to replacements, so find the real end of the content
+        content_start = header.end()
+        end = end_pattern.search(data, content_start)
+        if end is None:
+            # No later string can be closed either, so the rest is copied as-is
+            break
 
-            try:
-                declared_length = int(serialized_data[length_start:length_end])
-            except ValueError:
-                # Not a valid length, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Check if this is followed by a quote
-            quote_pos = length_end + 1
-            if quote_pos >= len(serialized_data) or serialized_data[quote_pos] != '"':
-                # Not a string pattern, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # For WordPress data, we need to find the actual end by looking for the pattern
-            # that indicates the end of this serialized element
-            content_start = quote_pos + 1
-
-            # Look for the end pattern: "; followed by a valid next element or end
-            # We'll scan forward and look for "; patterns that could be valid endings
-            search_pos = content_start
-            content_end = -1
-
-            while search_pos < len(serialized_data):
-                # Look for "; pattern
-                quote_semicolon_pos = serialized_data.find('";', search_pos)
-                if quote_semicolon_pos == -1:
-                    break
-
-                # Check what comes after the semicolon
-                after_pos = quote_semicolon_pos + 2
-                if after_pos >= len(serialized_data):
-                    # End of data, this must be the end
-                    content_end = quote_semicolon_pos
-                    break
-
-                # Check if what follows looks like a valid serialized element
-                remaining = serialized_data[after_pos:]
-                if (remaining.startswith('s:') or  # string
-                    remaining.startswith('i:') or  # integer
-                    remaining.startswith('b:') or  # boolean
-                    remaining.startswith('d:') or  # double
-                    remaining.startswith('a:') or  # array
-                    remaining.startswith('O:') or  # object
-                    remaining.startswith('N;') or  # null
-                    remaining.startswith('}') or   # end of array/object
-                    remaining.startswith('}')):    # end of structure
-                    content_end = quote_semicolon_pos
-                    break
-
-                # Continue searching
-                search_pos = quote_semicolon_pos + 1
-
-            if content_end == -1:
-                # Couldn't find a valid end, just copy the character and continue
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Extract the actual content
-            content = serialized_data[content_start:content_end]
-            actual_length = len(content)
-
-            # Rebuild the string with correct length
-            result.append(f's:{actual_length}:"{content}";')
-
-            # Move past this entire string
-            i = content_end + 2  # +2 for the "; at the end
-        else:
-            # Not a string pattern, just copy the character
-            result.append(serialized_data[i])
-            i += 1
+        # Copy everything up to this string unchanged, then rebuild it with the correct length
+        content_end = end.start()
+        result.append(data[last:header.start()])
+        result.append(b's:%d:"' % (content_end - content_start))
+        result.append(data[content_start:content_end])
+        result.append(b'";')
 
-    return ''.join(result)
+        # Move past this entire string
+        last = end.end()
+        header = _PHP_STRING_HEADER.search(data, last)
+
+    result.append(data[last:])
+    return b''.join(result).decode('utf-8')
 
 def _replace_in_json_data(json_data: str, search_term: str, replace_term: str) -> str:
     """Safely replace text in JSON data"""
-    try:
-        # Parse JSON, replace in string values, and re-serialize
-        data = json.loads(json_data)
-        modified_data = _replace_in_json_object(data, search_term, replace_term)
-        # Use compact separators to ensure single-line output without spaces
-        return json.dumps(modified_data, ensure_ascii=False, separators=(',', ':'))
-    except Exception:
-        # If anything goes wrong, fall back to simple replacement
+    # Nothing to replace, so there is no need to parse and re-serialize the value
+    if search_term not in json_data:
+        return json_data
+
+    new_value = _replace_in_json_value(json_data, search_term, replace_term)
+    if new_value is None:
+        # Not valid JSON, fall back to simple replacement
         return json_data.replace(search_term, replace_term)
+    return new_value
 
 def _replace_in_json_object(obj, search_term: str, replace_term: str):
-    """Recursively replace text in JSON object"""
-    if isinstance(obj, dict):
-        return {key: _replace_in_json_object(value, search_term, replace_term) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [_replace_in_json_object(item, search_term, replace_term) for item in obj]
-    elif isinstance(obj, str):
+    """
+    Replace text in the string values of a parsed JSON object.
+    Containers are updated in place and walked with an explicit stack, so deeply
+    nested data neither copies every level nor hits the recursion limit.
+    Parsed JSON only holds exact built-in types, so values are dispatched on
+    type() identity rather than isinstance checks.
+    """
+    obj_type = type(obj)
+    if obj_type is str:
         return obj.replace(search_term, replace_term)
-    else:
+    if obj_type is not dict and obj_type is not list:
         return obj
 
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        items = container.items() if type(container) is dict else enumerate(container)
+        for key, value in items:
+            value_type = type(value)
+            if value_type is str:
+                if search_term in value:
+                    container[key] = value.replace(search_term, replace_term)
+            elif value_type is dict or value_type is list:
+                stack.append(value)
+
+    return obj
+
+# Replacement handler for each kind of value returned by _classify_serialized_value; each
+# takes the value, the search and replace terms and a list collecting any warnings
+_REPLACE_HANDLERS = {
+    'php': _replace_in_php_value,
+    'json': _replace_in_json_value,
+    'plain': _replace_in_plain_value,
+}
+
+def _backup_changes_path(backup_file: Path, backup_data: Dict[str, Any]) -> Optional[Path]:
+    """Get the changes file of a backup, or None for backups that store changes inline"""
+    changes_file = backup_data.get("changes_file")
+    return backup_file.parent / changes_file if changes_file else None
+
+def _count_backup_changes(backup_file: Path, backup_data: Dict[str, Any]) -> int:
+    """Count the changes recorded in a backup without parsing them"""
+    changes_path = _backup_changes_path(backup_file, backup_data)
+    if changes_path is None:
+        return len(backup_data.get("changes", []))
+    if not changes_path.exists():
+        return 0
+
+    with open(changes_path, 'r') as f:
+        return sum(1 for line in f if line.strip())
+
+def _load_backup_changes(backup_file: Path, backup_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Load the changes recorded in a backup"""
+    changes_path = _backup_changes_path(backup_file, backup_data)
+    if changes_path is None:
+        # Older backups keep the changes in the backup file itself
+        return backup_data.get("changes", [])
+    if not changes_path.exists():
+        return []
+
+    with open(changes_path, 'r', encoding='utf-8') as f:
+        return [_json_loads(line) for line in f if line.strip()]
+
 def _undo_last_operation():
     """Undo the last search and replace operation"""
     # Get list of backup files
@@ -1594,19 +1855,19 @@ def _undo_last_operation():
     # Sort by modification time (newest first)
     backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
 
-    # Show available backups
+    # Show available backups, each choice carrying the index of its backup file
     choices = []
-    for backup_file in backup_files[:10]:  # Show last 10 backups
+    for index, backup_file in enumerate(backup_files[:10]):  # Show last 10 backups
         with open(backup_file, 'r') as f:
             backup_data = json.load(f)
 
         timestamp = backup_data.get("timestamp", "Unknown")
         search_term = backup_data.get("search_term", "Unknown")
-        changes_count = len(backup_data.get("changes", []))
+        changes_count = _count_backup_changes(backup_file, backup_data)
 
-        choices.append(f"{timestamp} - Search: '{search_term}' ({changes_count} changes)")
+        choices.append((f"{timestamp} - Search: '{search_term}' ({changes_count} changes)", index))
 
-    choices.append("Cancel")
+    choices.append(("Cancel", None))
 
     questions = [
         inquirer.List(
@@ -1617,21 +1878,17 @@ def _undo_last_operation():
     ]
 
     answers = inquirer.prompt(questions)
-    if not answers or answers["backup_choice"] == "Cancel":
+    if not answers or answers["backup_choice"] is None:
         return
 
     # Get selected backup file
-    selected_index = choices.index(answers["backup_choice"])
-    if selected_index >= len(backup_files):
-        return
-
-    backup_file = backup_files[selected_index]
+    backup_file = backup_files[answers["backup_choice"]]
 
     # Load backup data
     with open(backup_file, 'r') as f:
         backup_data = json.load(f)
 
-    changes = backup_data.get("changes", [])
+    changes = _load_backup_changes(backup_file, backup_data)
 
     if not changes:
         console.print("❌ No changes found in backup file!", style="bold red")
@@ -1664,25 +1921,26 @@ def _undo_last_operation():
             try:
                 undone_count = 0
 
+                # Group changes by table and column so each group is restored
+                # with a single executemany call
+                undo_batches = {}
                 for change in changes:
-                    table_name = change["table"]
-                    row_id = change["row_id"]
-                    column = change["column"]
-                    original_value = change["original_value"]
+                    undo_batches.setdefault((change["table"], change["column"]), []).append({
+                        "original_value": change["original_value"],
+                        "row_id": change["row_id"]
+                    })
 
-                    # Get primary key column name
-                    columns = get_inspector().get_columns(table_name)
-                    pk_column = columns[0]['name']
+                for (table_name, column), params_list in undo_batches.items():
+                    # Get primary key column name (cached per table)
+                    pk_column = _get_primary_key_column(table_name)
 
-                    # Restore original value
+                    # Restore original values
                     update_query = text(f"UPDATE `{table_name}` SET `{column}` = :original_value WHERE `{pk_column}` = :row_id")
-                    connection.execute(update_query, {
-                        "original_value": original_value,
-                        "row_id": row_id
-                    })
+                    connection.execute(update_query, params_list)
 
-                    undone_count += 1
-                    console.print(f"  ✅ Restored {table_name}.{column} for row {row_id}", style="green")
+                    undone_count += len(params_list)
+                    for params in params_list:
+                        console.print(f"  ✅ Restored {table_name}.{column} for row {params['row_id']}", style="green")
 
                 transaction.commit()
                 console.print(f"\n✅ Undo completed! {undone_count} changes restored.", style="bold green")
@@ -1697,7 +1955,18 @@ def _undo_last_operation():
     except Exception as e:
         console.print(f"❌ Error during undo operation: {e}", style="bold red")
 
-def _replace_in_php_serialized_with_phpserialize(serialized_data: str, search_term: str, replace_term: str) -> Optional[str]:
+def _unserialize_php(serialized_data: str) -> Optional[Any]:
+    """
+    Unserialize PHP data with the phpserialize library, or return None if it cannot be parsed.
+    Repeated short values are already cached by _replace_by_kind, so this isn't cached itself.
+    """
+    try:
+        return phpserialize.loads(serialized_data.encode('utf-8'))
+    except Exception:
+        return None
+
+def _replace_in_php_serialized_with_phpserialize(serialized_data: str, search_term: str, replace_term: str,
+                                                 warnings: Optional[List[str]] = None) -> Optional[str]:
     """
     Replace text in PHP serialized data using the phpserialize library.
     This is more reliable than manual parsing but requires the phpserialize package.
@@ -1706,17 +1975,12 @@ def _replace_in_php_serialized_with_phpserialize(serialized_data: str, search_te
     if not PHPSERIALIZE_AVAILABLE:
         return None
 
-    try:
-        # First, try to fix any obvious length issues in the data
-        fixed_data = _fix_malformed_serialized_data(serialized_data)
-
-        # Unserialize the data
-        try:
-            data = phpserialize.loads(fixed_data.encode('utf-8'))
-        except Exception:
-            # If the fixed data doesn't work, try the original
-            data = phpserialize.loads(serialized_data.encode('utf-8'))
+    # Malformed data is left to the custom parser, which already tolerates wrong lengths
+    data = _unserialize_php(serialized_data)
+    if data is None:
+        return None
 
+    try:
         # Recursively replace text in the data structure
         def replace_in_data(obj, search, replace):
             if isinstance(obj, dict):
@@ -1739,68 +2003,6 @@ def _replace_in_php_serialized_with_phpserialize(serialized_data: str, search_te
         return result
 
     except Exception as e:
-        console.print(f"⚠️  phpserialize replacement failed: {e}", style="yellow")
+        _warn(f"⚠️  phpserialize replacement failed: {e}", warnings)
         return None
 
-def _fix_malformed_serialized_data(serialized_data: str) -> str:
-    """
-    Attempt to fix common issues in malformed PHP serialized data,
-    particularly incorrect string lengths.
-    """
-    result = []
-    i = 0
-
-    while i < len(serialized_data):
-        # Look for string pattern s:length:"
-        if i + 1 < len(serialized_data) and serialized_data[i:i+2] == 's:':
-            # Find the length part
-            length_start = i + 2
-            length_end = serialized_data.find(':', length_start)
-
-            if length_end == -1:
-                # Not a valid string pattern, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            try:
-                declared_length = int(serialized_data[length_start:length_end])
-            except ValueError:
-                # Not a valid length, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Check if this is followed by a quote
-            quote_pos = length_end + 1
-            if quote_pos >= len(serialized_data) or serialized_data[quote_pos] != '"':
-                # Not a string pattern, just copy the character
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Find the actual end of the string by looking for "; pattern
-            content_start = quote_pos + 1
-            quote_semicolon_pos = serialized_data.find('";', content_start)
-
-            if quote_semicolon_pos == -1:
-                # Can't find the end, just copy what we have
-                result.append(serialized_data[i])
-                i += 1
-                continue
-
-            # Extract the actual content
-            actual_content = serialized_data[content_start:quote_semicolon_pos]
-            actual_length = len(actual_content)
-
-            # Rebuild the string with correct length
-            result.append(f's:{actual_length}:"{actual_content}";')
-
-            # Move past this entire string
-            i = quote_semicolon_pos + 2  # +2 for the "; at the end
-        else:
-            # Not a string pattern, just copy the character
-            result.append(serialized_data[i])
-            i += 1
-
-    return ''.join(result)
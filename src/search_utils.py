@@ -1,12 +1,24 @@
 import os
+import re
+import time
 import inquirer
 import datetime
+import functools
+import itertools
+import threading
+import concurrent.futures
 from rich.console import Console
 from rich.table import Table
-from sqlalchemy import inspect
-from sqlalchemy.sql import text
+from sqlalchemy import inspect, Integer
+from sqlalchemy.sql import text, bindparam
 from dotenv import load_dotenv
 
+try:
+    import questionary
+    QUESTIONARY_AVAILABLE = True
+except ImportError:
+    QUESTIONARY_AVAILABLE = False
+
 from src.db_utils import get_db_engine, get_db_inspector, check_db_connection_with_friendly_error
 
 console = Console()
@@ -19,13 +31,19 @@ engine = None
 inspector = None
 table_prefix = os.getenv('TABLE_PREFIX', '')
 
+# Worker threads may ask for the engine at the same time, so it is only created under this lock
+_engine_lock = threading.Lock()
+
 def get_engine():
     """Get database engine with error handling."""
     global engine
     if engine is None:
-        if not check_db_connection_with_friendly_error():
-            raise Exception("Database connection failed")
-        engine = get_db_engine()
+        with _engine_lock:
+            if engine is None:
+                if not check_db_connection_with_friendly_error():
+                    raise Exception("Database connection failed")
+                # Searches and exports only read, so skip the implicit transaction around each connection
+                engine = get_db_engine().execution_options(isolation_level="AUTOCOMMIT")
     return engine
 
 def get_inspector():
@@ -37,6 +55,202 @@ def get_inspector():
         inspector = get_db_inspector()
     return inspector
 
+@functools.lru_cache(maxsize=None)
+def _cached_table_names():
+    """Get the database table names, reflected once and reused across searches."""
+    return tuple(get_inspector().get_table_names())
+
+@functools.lru_cache(maxsize=None)
+def _cached_columns(table_name):
+    """
+    Get the columns of a table, reflected once and reused across searches.
+    The cache holds every table of a large site, since general search walks them all in turn
+    and a bounded cache would evict each table before it is reused; clear_schema_cache() ends it.
+    """
+    return tuple(get_inspector().get_columns(table_name))
+
+# Column types that can hold text worth searching with LIKE (CHAR, VARCHAR, TEXT, LONGTEXT, ...)
+TEXT_COLUMN_TYPE = re.compile(r'CHAR|TEXT', re.IGNORECASE)
+
+# Number of rows fetched at a time when streaming search results into a table
+RESULT_YIELD_PER = 256
+
+# Match type offered for columns with a MySQL FULLTEXT index
+FULLTEXT_MATCH = "Contains words (full-text index)"
+
+# Characters with a special meaning in MySQL boolean mode full-text searches
+FULLTEXT_OPERATOR_CHARS = re.compile(r'[+\-<>()~*"@]')
+
+# Exports of up to this many rows are read together with the count and not queried again
+EXPORT_PREFETCH_ROWS = 1000
+
+# Number of posts shown per page of search results
+POST_PAGE_SIZE = 100
+
+# Escape character for literal % and _ in "contains" LIKE patterns
+LIKE_ESCAPE_CHAR = "!"
+
+# Number of count queries general search runs at the same time
+GENERAL_SEARCH_MAX_WORKERS = 8
+
+# Number of tables general search counts matches in with one UNION ALL query
+GENERAL_SEARCH_TABLES_PER_QUERY = 10
+
+# Longer meta key lists are picked with autocomplete instead of a scrolling list
+META_KEY_AUTOCOMPLETE_THRESHOLD = 50
+
+# Longer export meta key lists are narrowed by a prefix before showing the checkbox list
+EXPORT_META_KEY_CHECKBOX_LIMIT = 50
+
+# Maximum number of distinct meta keys listed at once
+META_KEY_LIST_LIMIT = 500
+
+def _env_int(name, default=0):
+    """Read a whole number setting from the environment, warning about and ignoring invalid values"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        console.print(f"⚠️  Ignoring {name}={value!r} in .env: it must be a whole number", style="yellow")
+        return default
+
+# When set, post meta keys are listed from only this many of the most recent posts of a type
+META_KEY_SCOPE_LIMIT = _env_int('META_KEY_SCOPE_LIMIT')
+
+# Seconds for which the last export meta key selection is offered again
+EXPORT_SELECTION_REUSE_SECONDS = 600
+
+# Last export meta key selection per (meta table, post type), with the time it was made
+_last_export_meta_keys = {}
+
+# Background worker that lists meta keys while the user answers prompts
+_meta_keys_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+# Post fields that can be filtered on, mapped to the column names used in SQL
+POST_FILTER_COLUMNS = {
+    "post_title": "post_title",
+    "post_status": "post_status",
+    "post_date": "post_date",
+    "post_modified": "post_modified",
+    "post_name": "post_name",
+    "guid": "guid",
+    "post_author": "post_author",
+    "post_content": "post_content",
+    "ID": "ID",
+}
+
+@functools.lru_cache(maxsize=None)
+def _primary_key_column(table_name):
+    """Get the primary key column of a table, or None if it has none or a composite one"""
+    pk_columns = get_inspector().get_pk_constraint(table_name).get('constrained_columns') or []
+    return pk_columns[0] if len(pk_columns) == 1 else None
+
+@functools.lru_cache(maxsize=None)
+def _searchable_column_names(table_name):
+    """
+    Get the names of the columns of a table that can contain text.
+    Numeric and date columns are left out of all-fields searches; if no column
+    type can be recognised, every column is searched as before.
+    The type names are only checked once per table for the session.
+    """
+    columns_info = _cached_columns(table_name)
+    column_names = tuple(
+        col['name'] for col in columns_info
+        if TEXT_COLUMN_TYPE.search(str(col['type']))
+    )
+    return column_names or tuple(col['name'] for col in columns_info)
+
+def _is_mysql():
+    """Check if the database is MySQL or MariaDB, whose index hints and FULLTEXT indexes are used"""
+    return get_engine().dialect.name in ("mysql", "mariadb")
+
+@functools.lru_cache(maxsize=None)
+def _meta_key_index_hint(meta_table):
+    """
+    Get the index hint that keeps MySQL on the meta_key index of a meta table.
+    Returns an empty string on other databases or when the index is missing.
+    The first call also suggests adding a meta_value index if there is none.
+    """
+    if not _is_mysql():
+        return ""
+    
+    indexes = get_inspector().get_indexes(meta_table)
+    if not any("meta_value" in index['column_names'] for index in indexes):
+        console.print(
+            f"💡 Meta value searches on {meta_table} scan every row for the key. An index can speed them up:\n"
+            f"   ALTER TABLE `{meta_table}` ADD INDEX meta_key_value (meta_key(32), meta_value(64));",
+            style="yellow"
+        )
+    
+    if any(index['name'] == "meta_key" for index in indexes):
+        return "USE INDEX (meta_key)"
+    return ""
+
+@functools.lru_cache(maxsize=None)
+def _fulltext_indexed_columns(table_name):
+    """
+    Get the columns of a table that have a FULLTEXT index of their own.
+    Only MySQL has these indexes, so other databases get an empty tuple.
+    """
+    if not _is_mysql():
+        return ()
+    
+    return tuple(
+        index['column_names'][0] for index in get_inspector().get_indexes(table_name)
+        if len(index['column_names']) == 1
+        and any(key.endswith("_prefix") and value == "FULLTEXT" for key, value in index.get('dialect_options', {}).items())
+    )
+
+def _fulltext_boolean_terms(value):
+    """Turn the words of a search value into a boolean mode full-text search requiring all of them"""
+    return " ".join(f"+{word}" for word in FULLTEXT_OPERATOR_CHARS.sub(" ", value).split())
+
+def _contains_pattern(search_term):
+    """LIKE pattern matching search_term anywhere, with its own % and _ taken literally"""
+    for char in (LIKE_ESCAPE_CHAR, "%", "_"):
+        search_term = search_term.replace(char, LIKE_ESCAPE_CHAR + char)
+    return f"%{search_term}%"
+
+@functools.lru_cache(maxsize=128)
+def _cached_text(sql, expanding=(), integer=()):
+    """
+    Build a text() statement once per distinct SQL string.
+    Searches repeat a small set of query shapes with different parameter values,
+    so reusing the statement skips re-parsing its bind parameters every time.
+    Parameters named in expanding take a list of values for an IN clause,
+    typed as Integer when they are also named in integer.
+    """
+    statement = text(sql)
+    if expanding:
+        statement = statement.bindparams(*[
+            bindparam(name, expanding=True, type_=Integer if name in integer else None) for name in expanding
+        ])
+    return statement
+
+def search_text(sql, params):
+    """
+    Get the cached statement for a search query, binding its list parameters as expanding.
+    Lists of integers, such as IDs, are bound with the Integer type.
+    """
+    expanding = tuple(sorted(name for name, value in params.items() if isinstance(value, list)))
+    integer = tuple(name for name in expanding if params[name] and all(type(value) is int for value in params[name]))
+    return _cached_text(sql, expanding, integer)
+
+def clear_schema_cache():
+    """Forget cached table, column and meta key information so it is read again."""
+    _cached_table_names.cache_clear()
+    _cached_columns.cache_clear()
+    _searchable_column_names.cache_clear()
+    _primary_key_column.cache_clear()
+    _query_distinct_meta_keys.cache_clear()
+    _meta_key_index_hint.cache_clear()
+    _fulltext_indexed_columns.cache_clear()
+    # The inspector keeps its own reflection cache as well
+    if inspector is not None:
+        inspector.clear_cache()
+
 # Common table names
 users_table = f"{table_prefix}users"
 usermeta_table = f"{table_prefix}usermeta"
@@ -45,40 +259,30 @@ postmeta_table = f"{table_prefix}postmeta"
 
 def search_database():
     """Main search menu function"""
+    # Menu entries and the search each one runs
+    search_options = {
+        "1. Search Users": search_users,
+        "2. Search Orders": search_orders,
+        "3. Search Coupons": search_coupons,
+        "4. Search Posts": search_regular_posts,
+        "5. Search Pages": lambda: search_posts(post_type="page", display_name="Page"),
+        "6. Search Custom Post Type": search_custom_post_type,
+        "7. General Search": general_search,
+    }
+    
     questions = [
         inquirer.List(
             "search_option",
             message="🔍 Select search type",
-            choices=[
-                "1. Search Users", 
-                "2. Search Orders", 
-                "3. Search Coupons", 
-                "4. Search Posts",
-                "5. Search Pages",
-                "6. Search Custom Post Type",
-                "7. General Search", 
-                "Back"
-            ],
+            choices=[*search_options, "Back"],
         )
     ]
     answers = inquirer.prompt(questions)
     
-    if answers["search_option"] == "1. Search Users":
-        search_users()
-    elif answers["search_option"] == "2. Search Orders":
-        search_orders()
-    elif answers["search_option"] == "3. Search Coupons":
-        search_coupons()
-    elif answers["search_option"] == "4. Search Posts":
-        search_regular_posts()
-    elif answers["search_option"] == "5. Search Pages":
-        search_posts(post_type="page", display_name="Page")
-    elif answers["search_option"] == "6. Search Custom Post Type":
-        search_custom_post_type()
-    elif answers["search_option"] == "7. General Search":
-        general_search()
-    elif answers["search_option"] == "Back":
+    if answers["search_option"] == "Back":
         return
+    
+    search_options[answers["search_option"]]()
 
 def search_users(export_mode=False):
     """
@@ -92,11 +296,11 @@ def search_users(export_mode=False):
     """
     try:
         # Check if tables exist
-        if users_table not in get_inspector().get_table_names():
+        if users_table not in _cached_table_names():
             console.print(f"❌ Table {users_table} not found!", style="bold red")
             return None if export_mode else None
 
-        if usermeta_table not in get_inspector().get_table_names():
+        if usermeta_table not in _cached_table_names():
             console.print(f"❌ Table {usermeta_table} not found!", style="bold red")
             return None if export_mode else None
         
@@ -118,10 +322,10 @@ def search_users(export_mode=False):
         
         if search_type == "Back":
             return None if export_mode else None
-            
-        # We'll collect selected meta keys for export later
-        selected_export_meta_keys = []
         
+        # Start listing the meta keys for the export now, they are needed after the search prompts
+        export_meta_keys_future = _prefetch_meta_keys(usermeta_table) if export_mode else None
+            
         if search_type == "1. Search by user fields":
             # Ask which field to filter by
             field_questions = [
@@ -147,18 +351,17 @@ def search_users(export_mode=False):
 
             # Build WHERE clause based on selected field
             if filter_field == "All fields (general search)":
-                # Get column names
-                columns_info = get_inspector().get_columns(users_table)
-                column_names = [col['name'] for col in columns_info]
+                # Get the names of the columns that can contain text
+                column_names = _searchable_column_names(users_table)
                 
                 # Original behavior - search all fields
                 search_term = console.input("[bold blue]🔍 Enter search term for users: [/bold blue]")
                 where_conditions = []
                 for col in column_names:
-                    where_conditions.append(f"`{col}` LIKE :search_term")
+                    where_conditions.append(f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'")
                 
                 where_clause = " OR ".join(where_conditions)
-                params = {"search_term": f"%{search_term}%"}
+                params = {"search_term": _contains_pattern(search_term)}
                 
             elif filter_field in ["user_login", "user_email", "ID"]:
                 match_type = _get_match_type(filter_field)
@@ -171,25 +374,25 @@ def search_users(export_mode=False):
                     where_clause = f"{filter_field} = :term"
                     params = {"term": value}
                 elif match_type == "Contains":  # Contains
-                    where_clause = f"{filter_field} LIKE :term"
-                    params = {"term": f"%{value}%"}
+                    where_clause = f"{filter_field} LIKE :term ESCAPE '{LIKE_ESCAPE_CHAR}'"
+                    params = {"term": _contains_pattern(value)}
                 elif match_type == "In list (comma separated)":
-                    # Split by comma and remove whitespace
-                    values = [v.strip() for v in value.split(",")]
+                    # Split by comma and remove whitespace; IDs are bound as integers
+                    try:
+                        if filter_field == "ID":
+                            values = [int(v.strip()) for v in value.split(",")]
+                        else:
+                            values = [v.strip() for v in value.split(",")]
+                    except ValueError:
+                        console.print("❌ Invalid ID format. Please enter numbers separated by commas.", style="bold red")
+                        return None if export_mode else None
                     if not values:
                         console.print("❌ No valid values provided.", style="bold red")
                         return None if export_mode else None
                     
-                    # Build IN clause parameters
-                    in_clause_params = {}
-                    in_clause_list = []
-                    for i, val in enumerate(values):
-                        param_name = f"term_{i}"
-                        in_clause_params[param_name] = val
-                        in_clause_list.append(f":{param_name}")
-                    
-                    where_clause = f"{filter_field} IN ({', '.join(in_clause_list)})"
-                    params = in_clause_params
+                    # A single expanding parameter keeps the statement the same for any list length
+                    where_clause = f"{filter_field} IN :terms"
+                    params = {"terms": values}
             
             elif filter_field == "user_registered":
                 # Ask if the user wants to filter by date range
@@ -211,14 +414,16 @@ def search_users(export_mode=False):
                 from_date_str = console.input("[bold blue]🔍 Enter from date (YYYY-MM-DD) to find users registered after: [/bold blue]")
                 try:
                     # Validate from date format
-                    datetime.datetime.strptime(from_date_str, "%Y-%m-%d")
+                    if not _is_valid_date(from_date_str):
+                        raise ValueError(from_date_str)
                     
                     if date_range_option == "Yes":
                         # Also get the to date
                         to_date_str = console.input("[bold blue]🔍 Enter to date (YYYY-MM-DD) or leave empty: [/bold blue]")
                         if to_date_str.strip():
                             # Validate to date format
-                            datetime.datetime.strptime(to_date_str, "%Y-%m-%d")
+                            if not _is_valid_date(to_date_str):
+                                raise ValueError(to_date_str)
                             where_clause = "user_registered >= :from_date AND user_registered <= :to_date"
                             params = {"from_date": from_date_str, "to_date": to_date_str}
                         else:
@@ -234,78 +439,61 @@ def search_users(export_mode=False):
                     console.print("❌ Invalid date format. Please use YYYY-MM-DD format.", style="bold red")
                     return None if export_mode else None
             
-            # Execute search
+            # Execute search - all queries for this path share one connection
             with get_engine().connect() as connection:
-                # Count query
-                count_sql = text(f"SELECT COUNT(*) FROM `{users_table}` WHERE {where_clause}")
-                count_result = connection.execute(count_sql, params)
-                count = count_result.scalar()
+                if not export_mode:
+                    # Fetch one row past the display limit instead of counting every match
+                    select_sql = search_text(f"SELECT ID, user_login, user_email, user_registered, user_nicename, display_name FROM `{users_table}` WHERE {where_clause} LIMIT 101", params)
+                    result = connection.execute(select_sql, params, execution_options={"yield_per": RESULT_YIELD_PER})
+                    results_table = _user_results_table(result.keys(), itertools.islice(result, 100))
+                    count = results_table.row_count
+                    if result.fetchone() is not None:
+                        count = "100+"
+                    
+                    if count == 0:
+                        console.print("⚠️ No matching users found.", style="bold yellow")
+                        return None
+                    
+                    console.print(f"✅ Found {count} matching users", style="bold green")
+                    
+                    # Display results
+                    console.print(results_table)
+                    return None
+                
+                # Count the matches, keeping the rows of small results for the export
+                query = f"SELECT * FROM `{users_table}` WHERE {where_clause}"
+                count, prefetched_rows = _count_export_rows(
+                    connection, query, f"SELECT COUNT(*) FROM `{users_table}` WHERE {where_clause}", params
+                )
                 
                 if count == 0:
                     console.print("⚠️ No matching users found.", style="bold yellow")
-                    return None if export_mode else None
+                    return None
                 
                 console.print(f"✅ Found {count} matching users", style="bold green")
-                
-                # If in export mode, ask which meta keys to include AFTER search is done
-                if export_mode and count > 0:
-                    # First get all available meta keys
-                    all_meta_keys_sql = text(f"SELECT DISTINCT meta_key FROM `{usermeta_table}` ORDER BY meta_key LIMIT 500")
-                    all_meta_keys_result = connection.execute(all_meta_keys_sql)
-                    all_meta_keys = [row[0] for row in all_meta_keys_result]
-                    
-                    # Ask user to select which meta keys to include in export
-                    if all_meta_keys:
-                        meta_key_choices = [(meta_key, meta_key) for meta_key in all_meta_keys]
-                        
-                        console.print("Select which user meta keys to include in the export:", style="bold blue")
-                        meta_key_questions = [
-                            inquirer.Checkbox(
-                                "selected_meta_keys",
-                                message="Press space to select/deselect keys, Enter when done",
-                                choices=meta_key_choices,
-                            )
-                        ]
-                        
-                        meta_key_answers = inquirer.prompt(meta_key_questions)
-                        selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
-                        
-                        if selected_export_meta_keys:
-                            console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each user", style="bold green")
-                
-                    query = f"SELECT * FROM `{users_table}` WHERE {where_clause}"
-                    
-                    return (query, params, {
-                        "count": count, 
-                        "table": users_table, 
-                        "is_meta": False,
-                        "export_meta_keys": selected_export_meta_keys,
-                        "meta_table": usermeta_table
-                    })
-                
-                # Get results for display
-                select_sql = text(f"SELECT ID, user_login, user_email, user_registered, user_nicename, display_name FROM `{users_table}` WHERE {where_clause} LIMIT 100")
-                result = connection.execute(select_sql, params)
-                rows = result.fetchall()
-                
-                # Display results
-                display_user_results(result.keys(), rows)
-                return None
+            
+            # Ask which meta keys to include AFTER search is done
+            selected_export_meta_keys = _select_export_meta_keys(export_meta_keys_future.result(), meta_table=usermeta_table)
+            
+            return (query, params, {
+                "count": count, 
+                "table": users_table, 
+                "is_meta": False,
+                "export_meta_keys": selected_export_meta_keys,
+                "meta_table": usermeta_table,
+                "prefetched_rows": prefetched_rows
+            })
                 
         elif search_type == "2. Search by user meta data":
             # Get meta key filter prefix from user
             meta_prefix = console.input("[bold blue]Enter prefix to filter meta keys (leave empty for all): [/bold blue]")
             
             # Get available meta keys from usermeta table with filter
-            with get_engine().connect() as connection:
-                if meta_prefix:
-                    meta_keys_sql = text(f"SELECT DISTINCT meta_key FROM `{usermeta_table}` WHERE meta_key LIKE :prefix ORDER BY meta_key LIMIT 500")
-                    meta_keys_result = connection.execute(meta_keys_sql, {"prefix": f"{meta_prefix}%"})
-                else:
-                    meta_keys_sql = text(f"SELECT DISTINCT meta_key FROM `{usermeta_table}` ORDER BY meta_key LIMIT 500")
-                    meta_keys_result = connection.execute(meta_keys_sql)
-                
-                meta_keys = [row[0] for row in meta_keys_result]
+            if export_meta_keys_future is not None and not meta_prefix:
+                # Without a prefix these are the keys already being listed for the export
+                meta_keys = export_meta_keys_future.result()
+            else:
+                meta_keys = _distinct_meta_keys(usermeta_table, meta_prefix)
             
             # Meta data search
             if not meta_keys:
@@ -316,23 +504,14 @@ def search_users(export_mode=False):
                 
                 
             # Let user select a meta key for search
-            meta_key_questions = [
-                inquirer.List(
-                    "meta_key",
-                    message="Select a meta key to search by",
-                    choices=meta_keys + ["Back"],
-                )
-            ]
-            
-            meta_key_answers = inquirer.prompt(meta_key_questions)
-            selected_meta_key = meta_key_answers["meta_key"]
+            selected_meta_key = _select_meta_key(meta_keys)
             
             if selected_meta_key == "Back":
                 return None if export_mode else None
             
             # Show a sample value for the selected meta key
             with get_engine().connect() as connection:
-                sample_sql = text(f"""
+                sample_sql = _cached_text(f"""
                     SELECT um.user_id, um.meta_value 
                     FROM `{usermeta_table}` um
                     WHERE um.meta_key = :meta_key
@@ -340,7 +519,7 @@ def search_users(export_mode=False):
                 """)
                 
                 sample_result = connection.execute(sample_sql, {"meta_key": selected_meta_key})
-                sample_row = sample_result.fetchone()
+                sample_row = sample_result.first()
                 
                 if sample_row:
                     user_id, meta_value = sample_row
@@ -369,8 +548,8 @@ def search_users(export_mode=False):
                 meta_where_clause = "um.meta_value = :search_term"
                 params = {"meta_key": selected_meta_key, "search_term": search_term}
             elif match_type == "Contains":  # Contains
-                meta_where_clause = "um.meta_value LIKE :search_term"
-                params = {"meta_key": selected_meta_key, "search_term": f"%{search_term}%"}
+                meta_where_clause = f"um.meta_value LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'"
+                params = {"meta_key": selected_meta_key, "search_term": _contains_pattern(search_term)}
             elif match_type == "In list (comma separated)":
                 # Split by comma and remove whitespace
                 values = [v.strip() for v in search_term.split(",")]
@@ -378,129 +557,239 @@ def search_users(export_mode=False):
                     console.print("❌ No valid values provided.", style="bold red")
                     return None if export_mode else None
                 
-                # Build IN clause parameters
-                in_clause_params = {"meta_key": selected_meta_key}
-                in_clause_list = []
-                for i, val in enumerate(values):
-                    param_name = f"term_{i}"
-                    in_clause_params[param_name] = val
-                    in_clause_list.append(f":{param_name}")
-                
-                meta_where_clause = f"um.meta_value IN ({', '.join(in_clause_list)})"
-                params = in_clause_params
-                
-            # Execute the meta search query
+                # A single expanding parameter keeps the statement the same for any list length
+                meta_where_clause = "um.meta_value IN :terms"
+                params = {"meta_key": selected_meta_key, "terms": values}
+                
+            # Join users and usermeta tables
+            index_hint = _meta_key_index_hint(usermeta_table)
+            query = f"""
+                SELECT {'u.*' if export_mode else 'u.ID, u.user_login, u.user_email, u.user_registered, u.user_nicename, u.display_name'}
+                FROM `{users_table}` u
+                INNER JOIN `{usermeta_table}` um {index_hint} ON u.ID = um.user_id
+                WHERE um.meta_key = :meta_key
+                AND {meta_where_clause}
+            """
+            
+            # Execute the meta search queries on one connection
             with get_engine().connect() as connection:
-                # Join users and usermeta tables
-                query = f"""
-                    SELECT {'u.*' if export_mode else 'u.ID, u.user_login, u.user_email, u.user_registered, u.user_nicename, u.display_name'}
-                    FROM `{users_table}` u
-                    INNER JOIN `{usermeta_table}` um ON u.ID = um.user_id
-                    WHERE um.meta_key = :meta_key
-                    AND {meta_where_clause}
-                """
-                
-                # If in export mode, return the query and params
                 if export_mode:
-                    
-                    # If in export mode, ask which filtered meta keys to include in the export
-                    # First get all available meta keys
-                    all_meta_keys_sql = text(f"SELECT DISTINCT meta_key FROM `{usermeta_table}` ORDER BY meta_key LIMIT 500")
-                    all_meta_keys_result = connection.execute(all_meta_keys_sql)
-                    all_meta_keys = [row[0] for row in all_meta_keys_result]
-                    
-                    # Ask user to select which meta keys to include in export
-                    if all_meta_keys:
-                        meta_key_choices = [(meta_key, meta_key) for meta_key in all_meta_keys]
-                        
-                        console.print("Select which user meta keys to include in the export:", style="bold blue")
-                        meta_key_questions = [
-                            inquirer.Checkbox(
-                                "selected_meta_keys",
-                                message="Press space to select/deselect keys, Enter when done",
-                                choices=meta_key_choices,
-                            )
-                        ]
-                        
-                        meta_key_answers = inquirer.prompt(meta_key_questions)
-                        selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
-                        
-                        if selected_export_meta_keys:
-                            console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each user", style="bold green")
-                    
-                    # if export_mode:
-                    #     meta_key_choices = [(meta_key, meta_key) for meta_key in meta_keys]
-                        
-                    #     console.print("Select which user meta keys to include in the export:", style="bold blue")
-                    #     meta_key_questions = [
-                    #         inquirer.Checkbox(
-                    #             "selected_meta_keys",
-                    #             message="Press space to select/deselect keys, Enter when done",
-                    #             choices=meta_key_choices,
-                    #         )
-                    #     ]
-                        
-                    #     meta_key_answers = inquirer.prompt(meta_key_questions)
-                    #     selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
-                        
-                    #     if selected_export_meta_keys:
-                    #         console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each user", style="bold green")
-
-                    count_sql = text(f"""
+                    count_sql = search_text(f"""
                         SELECT COUNT(DISTINCT u.ID) 
                         FROM `{users_table}` u
-                        INNER JOIN `{usermeta_table}` um ON u.ID = um.user_id
+                        INNER JOIN `{usermeta_table}` um {index_hint} ON u.ID = um.user_id
                         WHERE um.meta_key = :meta_key AND {meta_where_clause}
-                    """)
+                    """, params)
                     count_result = connection.execute(count_sql, params)
-                    count = count_result.scalar()
-                    
-                    if count == 0:
-                        console.print("⚠️ No matching users found.", style="bold yellow")
-                        return None
-                        
-                    console.print(f"✅ Found {count} matching users", style="bold green")
-                    
-                    return (
-                        query, 
-                        params, 
-                        {
-                            "count": count, 
-                            "table": users_table, 
-                            "meta_table": usermeta_table,
-                            "meta_key": selected_meta_key,
-                            "is_meta": True,
-                            "export_meta_keys": selected_export_meta_keys
-                        }
-                    )
-                
-                # For regular search mode
-                sql = text(query + " LIMIT 100")
-                result = connection.execute(sql, params)
-                rows = result.fetchall()
-                count = len(rows)
-                
-                if count == 0:
-                    console.print("⚠️ No matching users found.", style="bold yellow")
-                    return None
+                    count = count_result.scalar_one()
+                else:
+                    # For regular search mode
+                    sql = search_text(query + " LIMIT 100", params)
+                    result = connection.execute(sql, params, execution_options={"yield_per": RESULT_YIELD_PER})
+                    results_table = _user_results_table(result.keys(), result)
+                    count = results_table.row_count
+            
+            if count == 0:
+                console.print("⚠️ No matching users found.", style="bold yellow")
+                return None
+            
+            # If in export mode, ask which meta keys to include in the export and return the query and params
+            if export_mode:
+                selected_export_meta_keys = _select_export_meta_keys(export_meta_keys_future.result(), meta_table=usermeta_table)
                 
                 console.print(f"✅ Found {count} matching users", style="bold green")
                 
-                # Display results
-                display_user_results(result.keys(), rows)
-                return None
+                return (
+                    query, 
+                    params, 
+                    {
+                        "count": count, 
+                        "table": users_table, 
+                        "meta_table": usermeta_table,
+                        "meta_key": selected_meta_key,
+                        "is_meta": True,
+                        "export_meta_keys": selected_export_meta_keys
+                    }
+                )
+            
+            console.print(f"✅ Found {count} matching users", style="bold green")
+            
+            # Display results
+            console.print(results_table)
+            return None
                 
     except Exception as e:
         console.print(f"❌ User search failed: {e}", style="bold red")
         return None if export_mode else None
 
-def _get_match_type(term_type):
+def _count_export_rows(connection, query, count_query, params):
+    """
+    Count the rows of an export query. Results of up to EXPORT_PREFETCH_ROWS rows are then read
+    right away, so the export can write them without running the query again.
+    Returns the count and the (column names, rows) read, or None for larger results.
+    """
+    # The narrow count decides first, so full rows are only transferred when they're kept
+    count = connection.execute(search_text(count_query, params), params).scalar_one()
+    if count == 0 or count > EXPORT_PREFETCH_ROWS:
+        return count, None
+    
+    result = connection.execute(search_text(query, params), params)
+    rows = result.fetchall()
+    return len(rows), (list(result.keys()), rows)
+
+def _distinct_meta_keys(meta_table, prefix="", post_type=None):
+    """
+    Get up to 500 distinct meta keys from a meta table, optionally only those starting with prefix.
+    For the post meta table, keys are limited to posts of the given post_type, and without a prefix
+    only to the META_KEY_SCOPE_LIMIT most recent of them when that is set.
+    Listing the keys scans the whole meta table, so the result is cached for the session.
+    """
+    # Always pass every argument so equivalent calls share one cache entry
+    return _query_distinct_meta_keys(meta_table, prefix, post_type)
+
+@functools.lru_cache(maxsize=64)
+def _query_distinct_meta_keys(meta_table, prefix, post_type):
+    """Run the distinct meta key query for _distinct_meta_keys"""
+    conditions = []
+    params = {}
+    if post_type is not None and META_KEY_SCOPE_LIMIT and not prefix:
+        # Only read the meta rows of the most recent posts, joined through a derived table
+        # since MySQL does not allow LIMIT inside an IN subquery
+        meta_keys_sql = _cached_text(f"""
+            SELECT pm.meta_key
+            FROM (SELECT ID FROM `{posts_table}` WHERE post_type = :post_type ORDER BY ID DESC LIMIT {META_KEY_SCOPE_LIMIT}) p
+            JOIN `{meta_table}` pm ON pm.post_id = p.ID
+            GROUP BY pm.meta_key ORDER BY pm.meta_key LIMIT {META_KEY_LIST_LIMIT}
+        """)
+        with get_engine().connect() as connection:
+            return tuple(row[0] for row in connection.execute(meta_keys_sql, {"post_type": post_type}))
+    
+    if post_type is not None:
+        # EXISTS lets MySQL walk meta_key groups and stop at the first matching post,
+        # which an index on (meta_key, post_id) serves without a join over every meta row
+        conditions.append(
+            f"EXISTS (SELECT 1 FROM `{posts_table}` p WHERE p.ID = pm.post_id AND p.post_type = :post_type)"
+        )
+        params["post_type"] = post_type
+    if prefix:
+        conditions.append("pm.meta_key LIKE :prefix")
+        params["prefix"] = f"{prefix}%"
+    
+    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    meta_keys_sql = _cached_text(
+        f"SELECT pm.meta_key FROM `{meta_table}` pm {where_sql} GROUP BY pm.meta_key ORDER BY pm.meta_key LIMIT {META_KEY_LIST_LIMIT}"
+    )
+    
+    with get_engine().connect() as connection:
+        meta_keys_result = connection.execute(meta_keys_sql, params)
+        return tuple(row[0] for row in meta_keys_result)
+
+def _select_meta_key(meta_keys):
+    """Ask for one of the meta keys, returns "Back" if none was chosen"""
+    choices = meta_keys + ("Back",)
+    
+    # Long lists re-render slowly in inquirer, so filter them as the user types
+    if QUESTIONARY_AVAILABLE and len(meta_keys) > META_KEY_AUTOCOMPLETE_THRESHOLD:
+        selected_meta_key = questionary.autocomplete(
+            "Select a meta key to search by (type to filter)",
+            choices=list(choices),
+            validate=lambda value: value in choices,
+        ).ask()
+        return selected_meta_key or "Back"
+    
+    meta_key_questions = [
+        inquirer.List(
+            "meta_key",
+            message="Select a meta key to search by",
+            choices=choices,
+        )
+    ]
+    
+    meta_key_answers = inquirer.prompt(meta_key_questions)
+    return meta_key_answers["meta_key"]
+
+def _prefetch_meta_keys(meta_table, prefix="", post_type=None):
+    """Start _distinct_meta_keys in the background and return its future"""
+    # Connect first, so connection messages aren't printed over the prompts drawn meanwhile
+    get_engine()
+    return _meta_keys_pool.submit(_distinct_meta_keys, meta_table, prefix, post_type)
+
+def _select_export_meta_keys(all_meta_keys, item_name="user", meta_table=None, post_type=None):
+    """
+    Ask the user which meta keys of the item type (user, post, ...) to include in an export.
+    Long key lists are first narrowed by a prefix; without one the keys are typed in instead.
+    A recent selection for the same meta table and post type is offered again first.
+    """
+    selected_export_meta_keys = []
+    selection_key = (meta_table, post_type)
+    
+    last_selection = _last_export_meta_keys.get(selection_key)
+    if last_selection and time.monotonic() - last_selection[0] < EXPORT_SELECTION_REUSE_SECONDS:
+        reuse_questions = [
+            inquirer.Confirm(
+                "reuse_meta_keys",
+                message=f"Use the previous meta key selection ({', '.join(last_selection[1])})?",
+                default=True,
+            )
+        ]
+        
+        reuse_answers = inquirer.prompt(reuse_questions)
+        if reuse_answers["reuse_meta_keys"]:
+            return list(last_selection[1])
+    
+    if len(all_meta_keys) > EXPORT_META_KEY_CHECKBOX_LIMIT:
+        prefix = console.input(f"[bold blue]🔍 Filter {item_name} meta keys by prefix (leave empty to type the keys): [/bold blue]").strip()
+        if not prefix:
+            meta_keys_input = console.input(f"[bold blue]🔍 Enter {item_name} meta keys to export (comma separated, empty for none): [/bold blue]")
+            selected_export_meta_keys = [key.strip() for key in meta_keys_input.split(",") if key.strip()]
+            all_meta_keys = ()
+        elif len(all_meta_keys) < META_KEY_LIST_LIMIT or meta_table is None:
+            all_meta_keys = tuple(key for key in all_meta_keys if key.startswith(prefix))
+        else:
+            # The listing was cut off, so ask the database for the keys with this prefix
+            all_meta_keys = _distinct_meta_keys(meta_table, prefix, post_type)
+        
+        if prefix and not all_meta_keys:
+            console.print(f"⚠️ No {item_name} meta keys start with '{prefix}'", style="bold yellow")
+    
+    # Ask user to select which meta keys to include in export
+    if all_meta_keys:
+        meta_key_choices = [(meta_key, meta_key) for meta_key in all_meta_keys]
+        
+        console.print(f"Select which {item_name} meta keys to include in the export:", style="bold blue")
+        meta_key_questions = [
+            inquirer.Checkbox(
+                "selected_meta_keys",
+                message="Press space to select/deselect keys, Enter when done",
+                choices=meta_key_choices,
+            )
+        ]
+        
+        meta_key_answers = inquirer.prompt(meta_key_questions)
+        selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
+    
+    if selected_export_meta_keys:
+        console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each {item_name}", style="bold green")
+        _last_export_meta_keys[selection_key] = (time.monotonic(), tuple(selected_export_meta_keys))
+    
+    return selected_export_meta_keys
+
+@functools.lru_cache(maxsize=128)
+def _is_valid_date(date_str):
+    """Whether date_str is a YYYY-MM-DD date"""
+    try:
+        datetime.datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+def _get_match_type(term_type, extra_choices=()):
     """Helper function to determine match type (exact or contains)"""
     match_questions = [
         inquirer.List(
             "match_type",
             message=f"👉 Select how to match {term_type}",
-            choices=["Exact match", "Contains", "In list (comma separated)", "Back"],
+            choices=["Exact match", "Contains", *extra_choices, "In list (comma separated)", "Back"],
         )
     ]
     
@@ -509,6 +798,14 @@ def _get_match_type(term_type):
 
 def display_user_results(column_names, rows):
     """Helper function to display user search results in a table"""
+    console.print(_user_results_table(column_names, rows))
+
+def _column_width(column_count, min_width=20):
+    """Get the width that shares the console width equally between column_count table columns"""
+    return max(min_width, (console.size.width - column_count * 3) // column_count)
+
+def _user_results_table(column_names, rows):
+    """Build the user results table, adding rows as they are iterated"""
     results_table = Table(
         title=f"👤 User Search Results (showing up to 100 rows)",
         expand=True,  # Use full terminal width
@@ -516,8 +813,7 @@ def display_user_results(column_names, rows):
     )
 
     # Calculate optimal column widths
-    console_width = console.size.width
-    col_width = max(20, (console_width - (len(column_names) * 3)) // len(column_names))
+    col_width = _column_width(len(column_names))
 
     # Add columns
     for column_name in column_names:
@@ -528,7 +824,38 @@ def display_user_results(column_names, rows):
         string_values = [str(value) if value is not None else "" for value in row]
         results_table.add_row(*string_values)
     
-    console.print(results_table)
+    return results_table
+
+def _post_results_table(column_names, rows, title):
+    """Build a post results table, shortening post_content to 100 characters"""
+    results_table = Table(
+        title=title,
+        expand=True,  # Use full terminal width
+        show_lines=True
+    )
+
+    # Calculate optimal column widths
+    column_names = list(column_names)
+    col_width = _column_width(len(column_names), 25)
+    content_index = column_names.index('post_content') if 'post_content' in column_names else None
+
+    # Add columns
+    for column_name in column_names:
+        if column_name == 'post_content':
+            content_width = max(80, col_width * 2)  # Give more space to content
+            results_table.add_column(column_name, overflow="fold", width=content_width, max_width=content_width)
+        else:
+            results_table.add_column(column_name, overflow="fold", width=col_width, max_width=col_width)
+    
+    # Add rows
+    for row in rows:
+        string_values = [str(value) if value is not None else "" for value in row]
+        # The query cuts post_content to 101 characters, the last one only marks that there is more
+        if content_index is not None and len(string_values[content_index]) > 100:
+            string_values[content_index] = string_values[content_index][:100] + "..."
+        results_table.add_row(*string_values)
+    
+    return results_table
 
 def search_posts(post_type, export_mode=False, display_name=None):
     """
@@ -549,11 +876,11 @@ def search_posts(post_type, export_mode=False, display_name=None):
     
     try:
         # Check if tables exist
-        if posts_table not in get_inspector().get_table_names():
+        if posts_table not in _cached_table_names():
             console.print(f"❌ Table {posts_table} not found!", style="bold red")
             return None if export_mode else None
 
-        if postmeta_table not in get_inspector().get_table_names():
+        if postmeta_table not in _cached_table_names():
             console.print(f"❌ Table {postmeta_table} not found!", style="bold red")
             return None if export_mode else None
         
@@ -575,6 +902,9 @@ def search_posts(post_type, export_mode=False, display_name=None):
         
         if search_type == "Back":
             return None if export_mode else None
+        
+        # Start listing the meta keys of this post type for the export now, they are needed after the search prompts
+        export_meta_keys_future = _prefetch_meta_keys(postmeta_table, post_type=post_type) if export_mode else None
             
         # We'll collect selected meta keys for export later
         selected_export_meta_keys = []
@@ -585,19 +915,7 @@ def search_posts(post_type, export_mode=False, display_name=None):
                 inquirer.List(
                     "filter_field",
                     message=f"Select field to filter by",
-                    choices=[
-                        "All fields (general search)",
-                        "post_title", 
-                        "post_status",
-                        "post_date",
-                        "post_modified",
-                        "post_name",
-                        "guid",
-                        "post_author",
-                        "post_content",
-                        "ID",
-                        "Back"
-                    ],
+                    choices=["All fields (general search)", *POST_FILTER_COLUMNS, "Back"],
                 )
             ]
             
@@ -607,26 +925,34 @@ def search_posts(post_type, export_mode=False, display_name=None):
             if filter_field == "Back":
                 return None if export_mode else None
 
+            # Only known column names are interpolated into the SQL
+            if filter_field != "All fields (general search)":
+                if filter_field not in POST_FILTER_COLUMNS:
+                    console.print(f"❌ Unknown field: {filter_field}", style="bold red")
+                    return None if export_mode else None
+                filter_field = POST_FILTER_COLUMNS[filter_field]
+
             # Build WHERE clause based on selected field
-            base_condition = f"post_type = '{post_type}'"
+            base_condition = "post_type = :post_type"
             
             if filter_field == "All fields (general search)":
-                # Get column names
-                columns_info = get_inspector().get_columns(posts_table)
-                column_names = [col['name'] for col in columns_info]
+                # Get the names of the columns that can contain text
+                column_names = _searchable_column_names(posts_table)
                 
                 # Search all fields
                 search_term = console.input(f"[bold blue]🔍 Enter search term for {display_name.lower()}s: [/bold blue]")
                 where_conditions = []
                 for col in column_names:
-                    where_conditions.append(f"`{col}` LIKE :search_term")
+                    where_conditions.append(f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'")
                 
                 field_where_clause = " OR ".join(where_conditions)
                 where_clause = f"{base_condition} AND ({field_where_clause})"
-                params = {"search_term": f"%{search_term}%"}
+                params = {"search_term": _contains_pattern(search_term)}
                 
             elif filter_field in ["post_title", "post_status", "post_name", "guid", "post_author", "post_content"]:
-                match_type = _get_match_type(filter_field)
+                # Word searches are offered where a FULLTEXT index can answer them without a full scan
+                extra_match_types = (FULLTEXT_MATCH,) if filter_field in _fulltext_indexed_columns(posts_table) else ()
+                match_type = _get_match_type(filter_field, extra_match_types)
                 if match_type == "Back":
                     return None if export_mode else None
                     
@@ -636,25 +962,28 @@ def search_posts(post_type, export_mode=False, display_name=None):
                     field_where_clause = f"{filter_field} = :term"
                     params = {"term": value}
                 elif match_type == "Contains":  # Contains
-                    field_where_clause = f"{filter_field} LIKE :term"
-                    params = {"term": f"%{value}%"}
+                    field_where_clause = f"{filter_field} LIKE :term ESCAPE '{LIKE_ESCAPE_CHAR}'"
+                    params = {"term": _contains_pattern(value)}
+                elif match_type == FULLTEXT_MATCH:
+                    field_where_clause = f"MATCH({filter_field}) AGAINST (:term IN BOOLEAN MODE)"
+                    params = {"term": _fulltext_boolean_terms(value)}
                 elif match_type == "In list (comma separated)":
-                    # Split by comma and remove whitespace
-                    values = [v.strip() for v in value.split(",")]
+                    # Split by comma and remove whitespace; IDs are bound as integers
+                    try:
+                        if filter_field == "ID":
+                            values = [int(v.strip()) for v in value.split(",")]
+                        else:
+                            values = [v.strip() for v in value.split(",")]
+                    except ValueError:
+                        console.print("❌ Invalid ID format. Please enter numbers separated by commas.", style="bold red")
+                        return None if export_mode else None
                     if not values:
                         console.print("❌ No valid values provided.", style="bold red")
                         return None if export_mode else None
                     
-                    # Build IN clause parameters
-                    in_clause_params = {}
-                    in_clause_list = []
-                    for i, val in enumerate(values):
-                        param_name = f"term_{i}"
-                        in_clause_params[param_name] = val
-                        in_clause_list.append(f":{param_name}")
-                    
-                    field_where_clause = f"{filter_field} IN ({', '.join(in_clause_list)})"
-                    params = in_clause_params
+                    # A single expanding parameter keeps the statement the same for any list length
+                    field_where_clause = f"{filter_field} IN :terms"
+                    params = {"terms": values}
                 
                 where_clause = f"{base_condition} AND ({field_where_clause})"
             
@@ -672,16 +1001,9 @@ def search_posts(post_type, export_mode=False, display_name=None):
                             console.print("❌ No valid IDs provided.", style="bold red")
                             return None if export_mode else None
                             
-                        # Build IN clause parameters
-                        in_clause_params = {}
-                        in_clause_list = []
-                        for i, post_id in enumerate(post_ids):
-                            param_name = f"id_{i}"
-                            in_clause_params[param_name] = post_id
-                            in_clause_list.append(f":{param_name}")
-                        
-                        field_where_clause = f"ID IN ({', '.join(in_clause_list)})"
-                        params = in_clause_params
+                        # A single expanding parameter keeps the statement the same for any list length
+                        field_where_clause = "ID IN :terms"
+                        params = {"terms": post_ids}
                     except ValueError:
                         console.print("❌ Invalid ID format. Please enter numbers separated by commas.", style="bold red")
                         return None if export_mode else None
@@ -717,14 +1039,16 @@ def search_posts(post_type, export_mode=False, display_name=None):
                 from_date_str = console.input(f"[bold blue]🔍 Enter from date (YYYY-MM-DD) to find {display_name.lower()}s after: [/bold blue]")
                 try:
                     # Validate from date format
-                    datetime.datetime.strptime(from_date_str, "%Y-%m-%d")
+                    if not _is_valid_date(from_date_str):
+                        raise ValueError(from_date_str)
                     
                     if date_range_option == "Yes":
                         # Also get the to date
                         to_date_str = console.input("[bold blue]🔍 Enter to date (YYYY-MM-DD) or leave empty: [/bold blue]")
                         if to_date_str.strip():
                             # Validate to date format
-                            datetime.datetime.strptime(to_date_str, "%Y-%m-%d")
+                            if not _is_valid_date(to_date_str):
+                                raise ValueError(to_date_str)
                             field_where_clause = f"{filter_field} >= :from_date AND {filter_field} <= :to_date"
                             params = {"from_date": from_date_str, "to_date": to_date_str}
                         else:
@@ -741,12 +1065,25 @@ def search_posts(post_type, export_mode=False, display_name=None):
                     console.print("❌ Invalid date format. Please use YYYY-MM-DD format.", style="bold red")
                     return None if export_mode else None
             
+            # The post type is bound rather than inlined so the statement is reused
+            params["post_type"] = post_type
+            
             # Execute search
             with get_engine().connect() as connection:
-                # Count query
-                count_sql = text(f"SELECT COUNT(*) FROM `{posts_table}` WHERE {where_clause}")
-                count_result = connection.execute(count_sql, params)
-                count = count_result.scalar()
+                if not export_mode:
+                    # Show the results a page at a time instead of counting every match
+                    return _show_post_pages(connection, f"""
+                        SELECT ID, post_title, post_status, post_date, post_name, 
+                               post_modified, guid, post_author
+                        FROM `{posts_table}` 
+                        WHERE {where_clause}
+                    """, params, display_name, icon)
+                
+                # Count the matches, keeping the rows of small results for the export
+                query = f"SELECT * FROM `{posts_table}` WHERE {where_clause}"
+                count, prefetched_rows = _count_export_rows(
+                    connection, query, f"SELECT COUNT(*) FROM `{posts_table}` WHERE {where_clause}", params
+                )
                 
                 if count == 0:
                     console.print(f"⚠️ No matching {display_name.lower()}s found.", style="bold yellow")
@@ -755,38 +1092,10 @@ def search_posts(post_type, export_mode=False, display_name=None):
                 console.print(f"✅ Found {count} matching {display_name.lower()}s", style="bold green")
                 
                 # If in export mode, ask which meta keys to include AFTER search is done
-                if export_mode and count > 0:
-                    # First get all available meta keys for this post type
-                    all_meta_keys_sql = text(f"""
-                        SELECT DISTINCT meta_key FROM `{postmeta_table}` pm
-                        JOIN `{posts_table}` p ON pm.post_id = p.ID
-                        WHERE p.post_type = :post_type
-                        ORDER BY meta_key 
-                        LIMIT 500
-                    """)
-                    all_meta_keys_result = connection.execute(all_meta_keys_sql, {"post_type": post_type})
-                    all_meta_keys = [row[0] for row in all_meta_keys_result]
-                    
+                if export_mode:
                     # Ask user to select which meta keys to include in export
-                    if all_meta_keys:
-                        meta_key_choices = [(meta_key, meta_key) for meta_key in all_meta_keys]
-                        
-                        console.print(f"Select which {display_name.lower()} meta keys to include in the export:", style="bold blue")
-                        meta_key_questions = [
-                            inquirer.Checkbox(
-                                "selected_meta_keys",
-                                message="Press space to select/deselect keys, Enter when done",
-                                choices=meta_key_choices,
-                            )
-                        ]
-                        
-                        meta_key_answers = inquirer.prompt(meta_key_questions)
-                        selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
-                        
-                        if selected_export_meta_keys:
-                            console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each {display_name.lower()}", style="bold green")
+                    selected_export_meta_keys = _select_export_meta_keys(export_meta_keys_future.result(), display_name.lower(), postmeta_table, post_type)
                 
-                    query = f"SELECT * FROM `{posts_table}` WHERE {where_clause}"
                     return (query, params, {
                         "count": count, 
                         "table": posts_table, 
@@ -794,84 +1103,20 @@ def search_posts(post_type, export_mode=False, display_name=None):
                         "export_meta_keys": selected_export_meta_keys,
                         "meta_table": postmeta_table,
                         "post_type": post_type,
-                        "display_name": display_name
+                        "display_name": display_name,
+                        "prefetched_rows": prefetched_rows
                     })
                 
-                # Get results for display
-                select_sql = text(f"""
-                    SELECT ID, post_title, post_status, post_date, post_name, 
-                           post_modified, guid, post_author
-                    FROM `{posts_table}` 
-                    WHERE {where_clause} 
-                    ORDER BY post_date DESC 
-                    LIMIT 100
-                """)
-                result = connection.execute(select_sql, params)
-                rows = result.fetchall()
-                
-                # Display results
-                results_table = Table(
-                    title=f"{icon} {display_name} Search Results (showing up to 100 rows)",
-                    expand=True,  # Use full terminal width
-                    show_lines=True
-                )
-
-                # Calculate optimal column widths
-                console_width = console.size.width
-                column_keys = list(result.keys())  # Convert keys to a list for indexing
-                col_width = max(25, (console_width - (len(column_keys) * 3)) // len(column_keys))
-
-                # Add columns
-                for column_name in column_keys:
-                    if column_name == 'post_content':
-                        content_width = max(80, col_width * 2)  # Give more space to content
-                        results_table.add_column(column_name, overflow="fold", width=content_width, max_width=content_width)
-                    else:
-                        results_table.add_column(column_name, overflow="fold", width=col_width, max_width=col_width)
-                
-                # Add rows
-                for row in rows:
-                    string_values = []
-                    for i, value in enumerate(row):
-                        if column_keys[i] == 'post_content' and value:
-                            # Truncate post_content to 100 characters when displaying
-                            truncated_value = str(value)[:100]
-                            if len(str(value)) > 100:
-                                truncated_value += "..."
-                            string_values.append(truncated_value)
-                        else:
-                            string_values.append(str(value) if value is not None else "")
-                    
-                    results_table.add_row(*string_values)
-                
-                console.print(results_table)
-                return None
-                
         elif search_type.startswith("2. Search by"):  # Search by post meta data
             # Get meta key filter prefix from user
             meta_prefix = console.input("[bold blue]Enter prefix to filter meta keys (leave empty for all): [/bold blue]")
             
             # Get available meta keys from postmeta table with filter
-            with get_engine().connect() as connection:
-                if meta_prefix:
-                    meta_keys_sql = text(f"""
-                        SELECT DISTINCT meta_key FROM `{postmeta_table}` pm 
-                        JOIN `{posts_table}` p ON pm.post_id = p.ID
-                        WHERE p.post_type = :post_type
-                        AND meta_key LIKE :prefix 
-                        ORDER BY meta_key LIMIT 500
-                    """)
-                    meta_keys_result = connection.execute(meta_keys_sql, {"post_type": post_type, "prefix": f"{meta_prefix}%"})
-                else:
-                    meta_keys_sql = text(f"""
-                        SELECT DISTINCT meta_key FROM `{postmeta_table}` pm
-                        JOIN `{posts_table}` p ON pm.post_id = p.ID
-                        WHERE p.post_type = :post_type
-                        ORDER BY meta_key LIMIT 500
-                    """)
-                    meta_keys_result = connection.execute(meta_keys_sql, {"post_type": post_type})
-                
-                meta_keys = [row[0] for row in meta_keys_result]
+            if export_meta_keys_future is not None and not meta_prefix:
+                # Without a prefix these are the keys already being listed for the export
+                meta_keys = export_meta_keys_future.result()
+            else:
+                meta_keys = _distinct_meta_keys(postmeta_table, meta_prefix, post_type)
             
             # Meta data search
             if not meta_keys:
@@ -880,43 +1125,15 @@ def search_posts(post_type, export_mode=False, display_name=None):
             
             console.print(f"✅ Found {len(meta_keys)} meta keys" + (f" starting with '{meta_prefix}'" if meta_prefix else ""), style="bold green")
                 
-            # If in export mode, ask which filtered meta keys to include in the export
-            # if export_mode:
-            #     meta_key_choices = [(meta_key, meta_key) for meta_key in meta_keys]
-                
-            #     console.print(f"Select which {display_name.lower()} meta keys to include in the export:", style="bold blue")
-            #     meta_key_questions = [
-            #         inquirer.Checkbox(
-            #             "selected_meta_keys",
-            #             message="Press space to select/deselect keys, Enter when done",
-            #             choices=meta_key_choices,
-            #         )
-            #     ]
-                
-            #     meta_key_answers = inquirer.prompt(meta_key_questions)
-            #     selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
-                
-            #     if selected_export_meta_keys:
-            #         console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each {display_name.lower()}", style="bold green")
-                
             # Let user select a meta key for search
-            meta_key_questions = [
-                inquirer.List(
-                    "meta_key",
-                    message="Select a meta key to search by",
-                    choices=meta_keys + ["Back"],
-                )
-            ]
-            
-            meta_key_answers = inquirer.prompt(meta_key_questions)
-            selected_meta_key = meta_key_answers["meta_key"]
+            selected_meta_key = _select_meta_key(meta_keys)
             
             if selected_meta_key == "Back":
                 return None if export_mode else None
             
             # Show a sample value for the selected meta key
             with get_engine().connect() as connection:
-                sample_sql = text(f"""
+                sample_sql = _cached_text(f"""
                     SELECT pm.post_id, pm.meta_value 
                     FROM `{postmeta_table}` pm
                     JOIN `{posts_table}` p ON pm.post_id = p.ID
@@ -926,7 +1143,7 @@ def search_posts(post_type, export_mode=False, display_name=None):
                 """)
                 
                 sample_result = connection.execute(sample_sql, {"post_type": post_type, "meta_key": selected_meta_key})
-                sample_row = sample_result.fetchone()
+                sample_row = sample_result.first()
                 
                 if sample_row:
                     post_id, meta_value = sample_row
@@ -955,8 +1172,8 @@ def search_posts(post_type, export_mode=False, display_name=None):
                 meta_where_clause = "pm.meta_value = :search_term"
                 params = {"post_type": post_type, "meta_key": selected_meta_key, "search_term": search_term}
             elif match_type == "Contains":  # Contains
-                meta_where_clause = "pm.meta_value LIKE :search_term"
-                params = {"post_type": post_type, "meta_key": selected_meta_key, "search_term": f"%{search_term}%"}
+                meta_where_clause = f"pm.meta_value LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'"
+                params = {"post_type": post_type, "meta_key": selected_meta_key, "search_term": _contains_pattern(search_term)}
             elif match_type == "In list (comma separated)":
                 # Split by comma and remove whitespace
                 values = [v.strip() for v in search_term.split(",")]
@@ -964,16 +1181,9 @@ def search_posts(post_type, export_mode=False, display_name=None):
                     console.print("❌ No valid values provided.", style="bold red")
                     return None if export_mode else None
                 
-                # Build IN clause parameters
-                in_clause_params = {"post_type": post_type, "meta_key": selected_meta_key}
-                in_clause_list = []
-                for i, val in enumerate(values):
-                    param_name = f"term_{i}"
-                    in_clause_params[param_name] = val
-                    in_clause_list.append(f":{param_name}")
-                
-                meta_where_clause = f"pm.meta_value IN ({', '.join(in_clause_list)})"
-                params = in_clause_params
+                # A single expanding parameter keeps the statement the same for any list length
+                meta_where_clause = "pm.meta_value IN :terms"
+                params = {"post_type": post_type, "meta_key": selected_meta_key, "terms": values}
                 
             # Execute the meta search query
             with get_engine().connect() as connection:
@@ -989,15 +1199,15 @@ def search_posts(post_type, export_mode=False, display_name=None):
                 
                 # If in export mode, return the query and params
                 if export_mode:
-                    count_sql = text(f"""
+                    count_sql = search_text(f"""
                         SELECT COUNT(DISTINCT p.ID) 
                         FROM `{posts_table}` p
                         INNER JOIN `{postmeta_table}` pm ON p.ID = pm.post_id
                         WHERE p.post_type = :post_type
                         AND pm.meta_key = :meta_key AND {meta_where_clause}
-                    """)
+                    """, params)
                     count_result = connection.execute(count_sql, params)
-                    count = count_result.scalar()
+                    count = count_result.scalar_one()
                     
                     if count == 0:
                         console.print(f"⚠️ No matching {display_name.lower()}s found.", style="bold yellow")
@@ -1006,35 +1216,8 @@ def search_posts(post_type, export_mode=False, display_name=None):
                     console.print(f"✅ Found {count} matching {display_name.lower()}s", style="bold green")
                     
                     
-                    # First get all available meta keys for this post type
-                    all_meta_keys_sql = text(f"""
-                        SELECT DISTINCT meta_key FROM `{postmeta_table}` pm
-                        JOIN `{posts_table}` p ON pm.post_id = p.ID
-                        WHERE p.post_type = :post_type
-                        ORDER BY meta_key 
-                        LIMIT 500
-                    """)
-                    all_meta_keys_result = connection.execute(all_meta_keys_sql, {"post_type": post_type})
-                    all_meta_keys = [row[0] for row in all_meta_keys_result]
-                    
                     # Ask user to select which meta keys to include in export
-                    if all_meta_keys:
-                        meta_key_choices = [(meta_key, meta_key) for meta_key in all_meta_keys]
-                        
-                        console.print(f"Select which {display_name.lower()} meta keys to include in the export:", style="bold blue")
-                        meta_key_questions = [
-                            inquirer.Checkbox(
-                                "selected_meta_keys",
-                                message="Press space to select/deselect keys, Enter when done",
-                                choices=meta_key_choices,
-                            )
-                        ]
-                        
-                        meta_key_answers = inquirer.prompt(meta_key_questions)
-                        selected_export_meta_keys = meta_key_answers["selected_meta_keys"]
-                        
-                        if selected_export_meta_keys:
-                            console.print(f"✅ Will export {len(selected_export_meta_keys)} meta keys for each {display_name.lower()}", style="bold green")
+                    selected_export_meta_keys = _select_export_meta_keys(export_meta_keys_future.result(), display_name.lower(), postmeta_table, post_type)
                                     
                     return (
                         query, 
@@ -1051,70 +1234,77 @@ def search_posts(post_type, export_mode=False, display_name=None):
                         }
                     )
                 
-                # For regular search mode
-                display_sql = text(f"""
+                # For regular search mode, show the results a page at a time
+                return _show_post_pages(connection, f"""
                     SELECT p.ID, p.post_title, p.post_status, p.post_date, p.post_name,
-                           p.post_modified, p.guid, p.post_author, p.post_content
+                           p.post_modified, p.guid, p.post_author,
+                           SUBSTRING(p.post_content, 1, 101) AS post_content
                     FROM `{posts_table}` p
                     INNER JOIN `{postmeta_table}` pm ON p.ID = pm.post_id
                     WHERE p.post_type = :post_type
                     AND pm.meta_key = :meta_key
                     AND {meta_where_clause}
-                    ORDER BY p.post_date DESC
-                    LIMIT 100
-                """)
-                result = connection.execute(display_sql, params)
-                rows = result.fetchall()
-                count = len(rows)
-                
-                if count == 0:
-                    console.print(f"⚠️ No matching {display_name.lower()}s found.", style="bold yellow")
-                    return None
-                
-                console.print(f"✅ Found {count} matching {display_name.lower()}s", style="bold green")
-                
-                # Display results
-                results_table = Table(
-                    title=f"{icon} {display_name} Search Results (showing up to 100 rows)",
-                    expand=True,  # Use full terminal width
-                    show_lines=True
-                )
-
-                # Calculate optimal column widths
-                console_width = console.size.width
-                column_keys = list(result.keys())  # Convert keys to a list for indexing
-                col_width = max(25, (console_width - (len(column_keys) * 3)) // len(column_keys))
-
-                # Add columns
-                for column_name in column_keys:
-                    if column_name == 'post_content':
-                        content_width = max(80, col_width * 2)  # Give more space to content
-                        results_table.add_column(column_name, overflow="fold", width=content_width, max_width=content_width)
-                    else:
-                        results_table.add_column(column_name, overflow="fold", width=col_width, max_width=col_width)
-                
-                # Add rows
-                for row in rows:
-                    string_values = []
-                    for i, value in enumerate(row):
-                        if column_keys[i] == 'post_content' and value:
-                            # Truncate post_content to 100 characters when displaying
-                            truncated_value = str(value)[:100]
-                            if len(str(value)) > 100:
-                                truncated_value += "..."
-                            string_values.append(truncated_value)
-                        else:
-                            string_values.append(str(value) if value is not None else "")
-                    
-                    results_table.add_row(*string_values)
-                
-                console.print(results_table)
-                return None
+                """, params, display_name, icon, column_prefix="p.")
                 
     except Exception as e:
         console.print(f"❌ {display_name} search failed: {e}", style="bold red")
         return None if export_mode else None
         
+def _show_post_pages(connection, select_sql, params, display_name, icon, column_prefix=""):
+    """
+    Show matching posts newest first, POST_PAGE_SIZE rows at a time.
+    select_sql is the query up to and including its WHERE conditions. Each further page
+    continues after the last (post_date, ID) shown instead of using OFFSET, so deep pages
+    are read straight from the post_date order rather than skipping every earlier row.
+    """
+    post_date_column, id_column = f"{column_prefix}post_date", f"{column_prefix}ID"
+    keyset_clause = f" AND ({post_date_column} < :last_date OR ({post_date_column} = :last_date AND {id_column} < :last_id))"
+    # One row past the page tells whether there is another page
+    order_clause = f" ORDER BY {post_date_column} DESC, {id_column} DESC LIMIT {POST_PAGE_SIZE + 1}"
+    page_params = dict(params)
+    page = 1
+    
+    while True:
+        page_sql = select_sql + (keyset_clause if page > 1 else "") + order_clause
+        result = connection.execute(search_text(page_sql, page_params), page_params)
+        rows = result.fetchall()
+        has_more = len(rows) > POST_PAGE_SIZE
+        rows = rows[:POST_PAGE_SIZE]
+        
+        if page == 1:
+            if not rows:
+                console.print(f"⚠️ No matching {display_name.lower()}s found.", style="bold yellow")
+                return None
+            
+            count = f"{POST_PAGE_SIZE}+" if has_more else len(rows)
+            console.print(f"✅ Found {count} matching {display_name.lower()}s", style="bold green")
+        
+        # Display results
+        console.print(_post_results_table(
+            result.keys(), rows,
+            f"{icon} {display_name} Search Results (page {page}, showing up to {POST_PAGE_SIZE} rows)",
+        ))
+        
+        if not has_more:
+            return None
+        
+        # Ask whether to show the next page
+        page_questions = [
+            inquirer.List(
+                "next_page",
+                message=f"More {display_name.lower()}s match",
+                choices=[f"Show next {POST_PAGE_SIZE}", "Done"],
+            )
+        ]
+        
+        page_answers = inquirer.prompt(page_questions)
+        if page_answers["next_page"] == "Done":
+            return None
+        
+        page_params["last_date"] = rows[-1].post_date
+        page_params["last_id"] = rows[-1].ID
+        page += 1
+
 def search_orders(export_mode=False):
     """Search WooCommerce orders - calls the generic search_posts function"""
     return search_posts(post_type="shop_order", export_mode=export_mode, display_name="Order")
@@ -1167,7 +1357,7 @@ def get_available_post_types():
     try:
         with get_engine().connect() as connection:
             # Get distinct post types from posts table
-            post_types_sql = text(f"""
+            post_types_sql = _cached_text(f"""
                 SELECT DISTINCT post_type 
                 FROM `{posts_table}` 
                 WHERE post_type NOT IN ('shop_order', 'shop_coupon', 'post', 'page',
@@ -1187,9 +1377,14 @@ def general_search():
     try:
         search_term = console.input("[bold blue]🔍 Enter search term: [/bold blue]")
         table_results = {}
+        
+        # An empty term would match every row of every table
+        if not search_term.strip():
+            console.print("⚠️ Please enter a search term.", style="bold yellow")
+            return
 
         # Get all table names and filter by prefix
-        available_tables = [name for name in get_inspector().get_table_names() if name.startswith(table_prefix)]
+        available_tables = [name for name in _cached_table_names() if name.startswith(table_prefix)]
         
         # If no tables match the prefix, inform the user
         if not available_tables:
@@ -1198,36 +1393,40 @@ def general_search():
             
         console.print(f"🔍 Searching through {len(available_tables)} tables...", style="bold blue")
         
-        # For each matching table, try to search and count results
+        # Reflect the text columns of each table first, so only the count queries run in the workers
+        table_columns = {}
         for table_name in available_tables:
             try:
-                # Use raw SQL for the search with SQL LIKE for pattern matching
-                with get_engine().connect() as connection:
-                    # Get all column names for the table
-                    columns_info = get_inspector().get_columns(table_name)
-                    column_names = [col['name'] for col in columns_info]
-                    
-                    # Build a WHERE clause to search across all columns with OR conditions
-                    where_conditions = []
-                    for col in column_names:
-                        where_conditions.append(f"`{col}` LIKE :search_term")
-                    
-                    # Skip if no columns (shouldn't happen)
-                    if not where_conditions:
-                        continue
-                        
-                    where_clause = " OR ".join(where_conditions)
-                    
-                    # Query to count matching rows
-                    count_sql = text(f"SELECT COUNT(*) FROM `{table_name}` WHERE {where_clause}")
-                    count_result = connection.execute(count_sql, {"search_term": f"%{search_term}%"})
-                    count = count_result.scalar()
-                    
-                    if count > 0:
-                        table_results[table_name] = count
+                column_names = _searchable_column_names(table_name)
             except Exception as e:
                 console.print(f"⚠️ Error searching table {table_name}: {e}", style="yellow")
                 continue
+            if column_names:
+                table_columns[table_name] = column_names
+        
+        # Count several tables per UNION ALL query and run the queries concurrently,
+        # every worker on its own pooled connection
+        table_names = list(table_columns)
+        table_groups = [
+            {table_name: table_columns[table_name] for table_name in table_names[i:i + GENERAL_SEARCH_TABLES_PER_QUERY]}
+            for i in range(0, len(table_names), GENERAL_SEARCH_TABLES_PER_QUERY)
+        ]
+        table_counts = {}
+        # Connect here so the workers share the engine instead of racing to create it
+        get_engine()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=GENERAL_SEARCH_MAX_WORKERS) as executor:
+            for group_counts in executor.map(lambda group: _count_tables_matches(group, search_term), table_groups):
+                table_counts.update(group_counts)
+        
+        # Collect the results in table order
+        for table_name in table_names:
+            count = table_counts[table_name]
+            if isinstance(count, Exception):
+                console.print(f"⚠️ Error searching table {table_name}: {count}", style="yellow")
+                continue
+            
+            if count > 0:
+                table_results[table_name] = count
 
         # Display results
         if table_results:
@@ -1251,6 +1450,48 @@ def general_search():
     except Exception as e:
         console.print(f"❌ Search failed: {e}", style="bold red")
 
+def _count_tables_matches(table_columns, search_term):
+    """
+    Count the matching rows of several tables, given as a dict of table name to column names, in one UNION ALL query.
+    If the combined query fails the tables are counted one by one, and a table that still fails maps to its exception.
+    """
+    params = {"search_term": _contains_pattern(search_term)}
+    selects = []
+    for i, (table_name, column_names) in enumerate(table_columns.items()):
+        where_clause = " OR ".join(f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'" for col in column_names)
+        selects.append(f"SELECT :table_{i} AS table_name, COUNT(*) AS matches FROM `{table_name}` WHERE {where_clause}")
+        params[f"table_{i}"] = table_name
+    
+    try:
+        with get_engine().connect() as connection:
+            count_result = connection.execute(_cached_text(" UNION ALL ".join(selects)), params)
+            return {table_name: matches for table_name, matches in count_result}
+    except Exception:
+        counts = {}
+        for table_name, column_names in table_columns.items():
+            try:
+                counts[table_name] = _count_table_matches(table_name, column_names, search_term)
+            except Exception as e:
+                counts[table_name] = e
+        return counts
+
+def _count_table_matches(table_name, column_names, search_term):
+    """Count the rows of a table where one of the columns matches the search term"""
+    # Build a WHERE clause to search across all columns with OR conditions
+    where_conditions = [f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'" for col in column_names]
+    
+    # Skip if no columns (shouldn't happen)
+    if not where_conditions:
+        return 0
+        
+    where_clause = " OR ".join(where_conditions)
+    
+    # Query to count matching rows
+    with get_engine().connect() as connection:
+        count_sql = _cached_text(f"SELECT COUNT(*) FROM `{table_name}` WHERE {where_clause}")
+        count_result = connection.execute(count_sql, {"search_term": _contains_pattern(search_term)})
+        return count_result.scalar_one()
+
 def view_results(engine, table_results, search_term):
     """Allow user to select and view search results for a specific table"""
     if not table_results:
@@ -1274,53 +1515,86 @@ def view_results(engine, table_results, search_term):
         return
         
     try:
-        # Get table schema to retrieve column names
-        columns_info = get_inspector().get_columns(selected_table)
-        column_names = [col['name'] for col in columns_info]
+        # Search the same text columns that general_search counted matches in
+        column_names = _searchable_column_names(selected_table)
         
         # Build a WHERE clause to search across all columns with OR conditions
         where_conditions = []
         for col in column_names:
-            where_conditions.append(f"`{col}` LIKE :search_term")
+            where_conditions.append(f"`{col}` LIKE :search_term ESCAPE '{LIKE_ESCAPE_CHAR}'")
             
         where_clause = " OR ".join(where_conditions)
         
-        # Query to get matching rows (limited to 100)
+        # Tables with a single-column primary key are paged through in key order, each page
+        # continuing after the last key shown instead of skipping earlier rows with OFFSET
+        pk_column = _primary_key_column(selected_table)
+        params = {"search_term": _contains_pattern(search_term)}
+        page = 1
+        
         with get_engine().connect() as connection:
-            select_sql = text(f"SELECT * FROM `{selected_table}` WHERE {where_clause} LIMIT 100")
-            result = connection.execute(select_sql, {"search_term": f"%{search_term}%"})
-            
-            # Get the results
-            rows = result.fetchall()
-            
-            if not rows:
-                console.print("⚠️ No rows found.", style="bold yellow")
-                return
+            while True:
+                select_sql = f"SELECT * FROM `{selected_table}` WHERE ({where_clause})"
+                if pk_column is None:
+                    select_sql += " LIMIT 100"
+                else:
+                    if page > 1:
+                        select_sql += f" AND `{pk_column}` > :after_id"
+                    # One row past the page tells whether there is another page
+                    select_sql += f" ORDER BY `{pk_column}` LIMIT 101"
+                
+                result = connection.execute(
+                    _cached_text(select_sql), params,
+                    execution_options={"yield_per": RESULT_YIELD_PER}
+                )
+                rows = list(itertools.islice(result, 100))
+                has_more = pk_column is not None and result.fetchone() is not None
                 
-            # Create a table for displaying the results
-            results_table = Table(
-                title=f"🔍 Results from {selected_table} (showing up to 100 rows)",
-                expand=True,  # Use full terminal width
-                show_lines=True
-            )
+                if not rows:
+                    console.print("⚠️ No rows found.", style="bold yellow")
+                    return
+                    
+                # Create a table for displaying the results
+                results_table = Table(
+                    title=f"🔍 Results from {selected_table} (page {page}, showing up to 100 rows)",
+                    expand=True,  # Use full terminal width
+                    show_lines=True
+                )
 
-            # Calculate optimal column widths
-            console_width = console.size.width
-            column_keys = list(result.keys())
-            col_width = max(20, (console_width - (len(column_keys) * 3)) // len(column_keys))
+                # Calculate optimal column widths
+                column_keys = list(result.keys())
+                col_width = _column_width(len(column_keys))
 
-            # Add columns to the table
-            for column_name in result.keys():
-                results_table.add_column(column_name, overflow="fold", width=col_width, max_width=col_width)
+                # Add columns to the table
+                for column_name in column_keys:
+                    results_table.add_column(column_name, overflow="fold", width=col_width, max_width=col_width)
+                    
+                # Add rows to the table
+                for row in rows:
+                    # Convert all values to strings
+                    string_values = [str(value) if value is not None else "" for value in row]
+                    results_table.add_row(*string_values)
+                    
+                # Print the table with results
+                console.print(results_table)
                 
-            # Add rows to the table
-            for row in rows:
-                # Convert all values to strings
-                string_values = [str(value) if value is not None else "" for value in row]
-                results_table.add_row(*string_values)
+                if not has_more:
+                    return
                 
-            # Print the table with results
-            console.print(results_table)
+                # Ask whether to show the next page
+                page_questions = [
+                    inquirer.List(
+                        "next_page",
+                        message=f"More rows in {selected_table} match",
+                        choices=["Show next 100", "Done"],
+                    )
+                ]
+                
+                page_answers = inquirer.prompt(page_questions)
+                if page_answers["next_page"] == "Done":
+                    return
+                
+                params["after_id"] = rows[-1]._mapping[pk_column]
+                page += 1
             
     except Exception as e:
         console.print(f"❌ Error viewing results: {e}", style="bold red")
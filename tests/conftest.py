@@ -6,10 +6,16 @@ import pytest
 import sys
 import os
 from unittest.mock import MagicMock, patch
+from rich.console import Console
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+@pytest.fixture(scope="session")
+def console():
+    """Rich console shared by the whole test session, since creating one probes the terminal"""
+    return Console(force_terminal=False, width=120)
+
 @pytest.fixture
 def mock_console():
     """Mock Rich console for testing"""
@@ -83,3 +89,129 @@ def mock_database_columns():
         MockColumn("price", MockType("DECIMAL(10,2)", float)),
         MockColumn("description", MockType("MEDIUMTEXT", str)),
     ]
+
+@pytest.fixture
+def sqlite_wp_engine():
+    """In-memory SQLite engine with a small WordPress-like options table"""
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.pool import StaticPool
+    from sqlalchemy.sql import text
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE wp_options ("
+            "option_id INTEGER PRIMARY KEY, "
+            "option_name VARCHAR(191), "
+            "option_value TEXT, "
+            "autoload VARCHAR(20))"
+        ))
+        connection.execute(
+            text("INSERT INTO wp_options VALUES (:id, :name, :value, :autoload)"),
+            [
+                {"id": 1, "name": "siteurl", "value": "https://example.com", "autoload": "yes"},
+                {"id": 2, "name": "home", "value": "https://example.com/home", "autoload": "yes"},
+                {"id": 3, "name": "widget", "value": 'a:1:{s:3:"url";s:19:"https://example.com";}', "autoload": "no"},
+                {"id": 4, "name": "blogname", "value": "My Blog", "autoload": "yes"},
+            ],
+        )
+
+    from search_replace import clear_schema_cache
+    clear_schema_cache()
+
+    with patch('search_replace.get_engine', return_value=engine), \
+         patch('search_replace.get_inspector', return_value=inspect(engine)):
+        yield engine
+
+    clear_schema_cache()
+
+@pytest.fixture
+def sqlite_search_engine():
+    """In-memory SQLite engine with WordPress-like users, usermeta, posts and postmeta tables"""
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.pool import StaticPool
+    from sqlalchemy.sql import text
+    import search_utils
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE TABLE {search_utils.users_table} ("
+            "ID INTEGER PRIMARY KEY, "
+            "user_login VARCHAR(60), "
+            "user_email VARCHAR(100), "
+            "user_registered DATETIME, "
+            "user_nicename VARCHAR(50), "
+            "display_name VARCHAR(250))"
+        ))
+        connection.execute(text(
+            f"CREATE TABLE {search_utils.usermeta_table} ("
+            "umeta_id INTEGER PRIMARY KEY, "
+            "user_id INTEGER, "
+            "meta_key VARCHAR(255), "
+            "meta_value TEXT)"
+        ))
+        connection.execute(
+            text(f"INSERT INTO {search_utils.users_table} VALUES (:id, :login, :email, '2024-01-01 00:00:00', :login, :login)"),
+            [{"id": i, "login": f"user{i}", "email": f"user{i}@example.com"} for i in range(1, 6)],
+        )
+        connection.execute(
+            text(f"INSERT INTO {search_utils.usermeta_table} (user_id, meta_key, meta_value) VALUES (:user_id, :key, :value)"),
+            [
+                {"user_id": i, "key": key, "value": f"{key}_{i}"}
+                for i in range(1, 6)
+                for key in ("first_name", "last_name", "nickname")
+            ],
+        )
+
+        connection.execute(text(
+            f"CREATE TABLE {search_utils.posts_table} ("
+            "ID INTEGER PRIMARY KEY, "
+            "post_title TEXT, "
+            "post_content TEXT, "
+            "post_status VARCHAR(20), "
+            "post_type VARCHAR(20), "
+            "post_date DATETIME, "
+            "post_name VARCHAR(200), "
+            "post_modified DATETIME, "
+            "guid VARCHAR(255), "
+            "post_author INTEGER)"
+        ))
+        connection.execute(text(
+            f"CREATE TABLE {search_utils.postmeta_table} ("
+            "meta_id INTEGER PRIMARY KEY, "
+            "post_id INTEGER, "
+            "meta_key VARCHAR(255), "
+            "meta_value TEXT)"
+        ))
+        connection.execute(
+            text(f"INSERT INTO {search_utils.posts_table} VALUES (:id, :title, :content, 'publish', :type, '2024-01-01 00:00:00', :name, '2024-01-01 00:00:00', '', 1)"),
+            [
+                {"id": i, "title": f"Post {i}", "content": f"Content of post {i}", "type": "post" if i <= 3 else "page", "name": f"post-{i}"}
+                for i in range(1, 6)
+            ],
+        )
+        connection.execute(
+            text(f"INSERT INTO {search_utils.postmeta_table} (post_id, meta_key, meta_value) VALUES (:post_id, :key, :value)"),
+            [
+                {"post_id": i, "key": key, "value": f"{key}_{i}"}
+                for i in range(1, 6)
+                for key in (("_edit_lock", "_thumbnail_id") if i <= 3 else ("_wp_page_template",))
+            ],
+        )
+
+    search_utils.clear_schema_cache()
+
+    with patch('search_utils.get_engine', return_value=engine), \
+         patch('search_utils.get_inspector', return_value=inspect(engine)):
+        yield engine
+
+    search_utils.clear_schema_cache()
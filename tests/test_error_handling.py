@@ -3,16 +3,13 @@ Test module for improved error handling in search and replace
 """
 
 import pytest
-from rich.console import Console
 
 class TestErrorHandling:
     """Test cases for error handling functionality"""
 
     @pytest.mark.unit
-    def test_column_type_detection(self, mock_database_columns, mock_console):
+    def test_column_type_detection(self, mock_database_columns, mock_console, console):
         """Test the improved column type detection"""
-        console = Console()
-
         # Test the column filtering logic
         text_columns = []
         for col in mock_database_columns:
@@ -36,10 +33,8 @@ class TestErrorHandling:
             assert col_name not in text_columns
 
     @pytest.mark.unit
-    def test_error_message_formatting(self):
+    def test_error_message_formatting(self, console):
         """Test that error messages are properly formatted"""
-        console = Console()
-
         # Test different types of exceptions
         test_exceptions = [
             Exception("Test error message"),
@@ -64,10 +59,8 @@ class TestErrorHandling:
                     assert len(error_str) > 0
 
     @pytest.mark.unit
-    def test_safe_table_processing(self):
+    def test_safe_table_processing(self, console):
         """Test safe table processing logic"""
-        console = Console()
-
         # Simulate problematic table scenarios
         problematic_scenarios = [
             {"name": "empty_table", "columns": [], "issue": "No columns"},
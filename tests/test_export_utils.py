@@ -0,0 +1,85 @@
+"""
+Test module for the export functions
+Exports stream from an in-memory SQLite database into files in a temporary directory.
+"""
+
+import csv
+import json
+import pytest
+from unittest.mock import MagicMock
+
+import search_utils
+
+
+@pytest.fixture
+def export_utils(sqlite_search_engine, tmp_path, monkeypatch):
+    """The export module using the SQLite search engine, importing it from the temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    from src import export_utils
+
+    monkeypatch.setattr(export_utils, 'get_engine', lambda: sqlite_search_engine)
+    monkeypatch.setattr(export_utils, 'BATCH_SIZE', 2)
+    return export_utils
+
+
+def _export(export_utils, filepath, export_format, meta_keys, csv_options=None):
+    """Stream all users into filepath and return the number of records exported"""
+    progress = MagicMock()
+    count = export_utils._stream_export(
+        f"SELECT * FROM `{search_utils.users_table}` WHERE ID IN :terms",
+        {"terms": [1, 2, 3, 4, 5]},
+        search_utils.usermeta_table, "user_id", meta_keys,
+        filepath, export_format, csv_options, progress, "task",
+    )
+    assert sum(call.kwargs["advance"] for call in progress.update.call_args_list) == count
+    return count
+
+
+class TestStreamExport:
+    """Test streaming export rows into files"""
+
+    @pytest.mark.unit
+    def test_json_export_in_batches(self, export_utils, tmp_path):
+        """Test that a JSON export spanning several batches is one valid array with meta data"""
+        filepath = tmp_path / "users.json"
+
+        assert _export(export_utils, filepath, "JSON", ["first_name"]) == 5
+
+        records = json.loads(filepath.read_text(encoding="utf-8"))
+        assert [record["user_login"] for record in records] == [f"user{i}" for i in range(1, 6)]
+        assert records[2]["first_name"] == "first_name_3"
+
+    @pytest.mark.unit
+    def test_csv_export_writes_header_and_rows(self, export_utils, tmp_path):
+        """Test that a CSV export writes the header with meta keys and one line per record"""
+        filepath = tmp_path / "users.csv"
+        csv_options = {"separator": ";", "encoding": "utf-8", "headings": "no_change"}
+
+        assert _export(export_utils, filepath, "CSV", ["nickname"], csv_options) == 5
+
+        with open(filepath, newline='', encoding="utf-8") as f:
+            rows = list(csv.reader(f, delimiter=";"))
+        assert rows[0][0] == "ID" and rows[0][-1] == "nickname"
+        assert len(rows) == 6
+        assert rows[5][-1] == "nickname_5"
+
+    @pytest.mark.unit
+    def test_prefetched_rows_are_written_without_query(self, export_utils, sqlite_search_engine, tmp_path):
+        """Test that rows read by the search are exported without running the export query"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        filepath = tmp_path / "users.json"
+        rows = [(1, "user1"), (2, "user2"), (3, "user3")]
+
+        count = export_utils._stream_export(
+            "SELECT ID, user_login FROM missing_table", {},
+            search_utils.usermeta_table, "user_id", [],
+            filepath, "JSON", None, MagicMock(), "task", (["ID", "user_login"], rows),
+        )
+
+        assert count == 3
+        assert statements == []
+        assert [record["user_login"] for record in json.loads(filepath.read_text(encoding="utf-8"))] == ["user1", "user2", "user3"]
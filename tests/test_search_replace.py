@@ -17,6 +17,7 @@ from search_replace import (
     _is_json_data,
     _replace_in_php_serialized,
     _replace_in_json_data,
+    _replace_in_json_object,
     _fix_php_serialized_lengths,
     SearchReplaceSession
 )
@@ -32,12 +33,24 @@ class TestSearchReplace:
         assert _is_php_serialized(sample_php_serialized_data['simple_array'])
         assert _is_php_serialized(sample_php_serialized_data['boolean_true'])
         assert _is_php_serialized(sample_php_serialized_data['integer'])
+        assert _is_php_serialized(sample_php_serialized_data['null'])
+        assert _is_php_serialized('d:1.5;')
 
         # Test invalid data
         assert not _is_php_serialized('regular string')
+        assert not _is_php_serialized('a:2 apples and a pear')
+        assert not _is_php_serialized('s: see notes;}')
+        assert not _is_php_serialized('a:2 apples {x}')
+        assert not _is_php_serialized('s:3 was; the score;')
+        assert not _is_php_serialized('i:5 items;')
+        assert not _is_php_serialized('d: see below;')
+        assert _is_php_serialized('d:-1.0E+25;')
+        assert _is_php_serialized('O:8:"stdClass":1:{s:1:"a";i:1;}')
         assert not _is_php_serialized('{"json": "data"}')
         assert not _is_php_serialized('')
         assert not _is_php_serialized(None)
+        assert not _is_php_serialized(b's:1:"a";')
+        assert not _is_php_serialized(42)
         
     @pytest.mark.unit
     def test_json_detection(self, sample_json_data):
@@ -54,7 +67,18 @@ class TestSearchReplace:
         assert not _is_json_data('regular string')
         assert not _is_json_data('a:2:{s:4:"name";s:4:"John";}')
         assert not _is_json_data('')
-        
+
+    @pytest.mark.unit
+    def test_unclosed_json_is_rejected_without_parsing(self):
+        """Test that text which only starts like a JSON container is rejected before parsing"""
+        with patch('search_replace._json_loads', side_effect=AssertionError("parsed")):
+            assert not _is_json_data('[gallery ids="1,2"] Holiday photos')
+            assert not _is_json_data('{not closed')
+            assert not _is_json_data('"quoted start')
+
+        # Replacement still works on such text
+        assert _safe_replace_in_serialized_data('[gallery] old', 'old', 'new') == '[gallery] new'
+
     @pytest.mark.unit
     def test_regular_string_replacement(self):
         """Test regular string replacement"""
@@ -100,7 +124,127 @@ class TestSearchReplace:
         fixed = _fix_php_serialized_lengths(modified)
         expected = 's:8:"Universe";'
         assert fixed == expected
-        
+
+        # Text around the strings is copied through untouched
+        fixed = _fix_php_serialized_lengths('a:2:{i:0;s:1:"Universe";i:1;s:1:"Grüße";}')
+        assert fixed == 'a:2:{i:0;s:8:"Universe";i:1;s:7:"Grüße";}'
+
+    @pytest.mark.unit
+    def test_php_serialized_multibyte_length(self):
+        """Test that serialized string lengths are counted in UTF-8 bytes like PHP does"""
+        original = 's:10:"Hello Welt";'
+        result = _safe_replace_in_serialized_data(original, "Welt", "Wörld")
+        # "Hello Wörld" is 11 characters but 12 bytes
+        assert result == 's:12:"Hello Wörld";'
+
+        # Same number of characters, but a different number of bytes
+        result = _safe_replace_in_serialized_data(original, "Welt", "Wält")
+        assert result == 's:11:"Hello Wält";'
+
+    @pytest.mark.unit
+    def test_phpserialize_parses_each_value_once(self):
+        """Test that phpserialize is tried once per value and failures fall back to the custom parser"""
+        import search_replace
+
+        fake_phpserialize = MagicMock()
+        fake_phpserialize.loads.side_effect = lambda data: {b"url": data.split(b'"')[3]}
+        fake_phpserialize.dumps.side_effect = lambda obj: b'a:1:{s:3:"url";s:%d:"%s";}' % (len(obj[b"url"]), obj[b"url"])
+        original = 'a:1:{s:3:"url";s:11:"example.com";}'
+
+        search_replace._replace_by_kind.cache_clear()
+        try:
+            with patch.object(search_replace, "PHPSERIALIZE_AVAILABLE", True), \
+                 patch.object(search_replace, "phpserialize", fake_phpserialize, create=True):
+                for _ in range(3):
+                    result = _safe_replace_in_serialized_data(original, "example.com", "example.org.uk")
+                    assert result == 'a:1:{s:3:"url";s:14:"example.org.uk";}'
+                assert fake_phpserialize.loads.call_count == 1
+
+                # Data phpserialize cannot parse goes straight to the custom parser
+                fake_phpserialize.loads.side_effect = ValueError("bad length")
+                malformed = 'a:1:{s:3:"url";s:99:"example.com";}'
+                result = _safe_replace_in_serialized_data(malformed, "example.com", "example.org.uk")
+                assert result == 'a:1:{s:3:"url";s:14:"example.org.uk";}'
+                assert fake_phpserialize.loads.call_count == 2
+        finally:
+            search_replace._replace_by_kind.cache_clear()
+
+    @pytest.mark.unit
+    def test_warnings_are_collected_instead_of_printed(self, capsys):
+        """Test that warnings go to the given list, also when the replacement comes from the cache"""
+        import search_replace
+
+        fake_phpserialize = MagicMock()
+        fake_phpserialize.loads.side_effect = ValueError("bad length")
+        original = 'a:1:{s:3:"url";s:11:"example.com";}'
+
+        search_replace._replace_by_kind.cache_clear()
+        try:
+            with patch.object(search_replace, "PHPSERIALIZE_AVAILABLE", True), \
+                 patch.object(search_replace, "phpserialize", fake_phpserialize, create=True):
+                for _ in range(2):
+                    warnings = []
+                    result = _safe_replace_in_serialized_data(original, "example.com", "example.org.uk", warnings=warnings)
+                    assert result == 'a:1:{s:3:"url";s:14:"example.org.uk";}'
+                    assert warnings == ["⚠️  phpserialize failed, falling back to custom parser"]
+        finally:
+            search_replace._replace_by_kind.cache_clear()
+
+        assert "phpserialize failed" not in capsys.readouterr().out
+
+    @pytest.mark.unit
+    def test_column_kinds_are_remembered(self):
+        """Test that the kind of data seen in a column is reused and corrected when it doesn't fit"""
+        column_kinds = {}
+        serialized = 'a:1:{s:3:"url";s:11:"example.com";}'
+
+        result = _safe_replace_in_serialized_data(serialized, "example.com", "example.org.uk", column_kinds, "option_value")
+        assert result == 'a:1:{s:3:"url";s:14:"example.org.uk";}'
+        assert column_kinds == {"option_value": "php"}
+
+        # A JSON value in the same column is still handled as JSON
+        result = _safe_replace_in_serialized_data('{"url": "example.com"}', "example.com", "example.org.uk", column_kinds, "option_value")
+        assert json.loads(result) == {"url": "example.org.uk"}
+        assert column_kinds == {"option_value": "json"}
+
+        # A plain column never treats serialized data as plain text
+        column_kinds = {"post_content": "plain"}
+        result = _safe_replace_in_serialized_data(serialized, "example.com", "example.org.uk", column_kinds, "post_content")
+        assert result == 'a:1:{s:3:"url";s:14:"example.org.uk";}'
+        assert column_kinds == {"post_content": "php"}
+
+    @pytest.mark.unit
+    def test_duplicate_values_are_replaced_once(self):
+        """Test that identical values are only classified and rebuilt once"""
+        import search_replace
+
+        search_replace._replace_by_kind.cache_clear()
+        value = 'a:1:{s:4:"lock";s:23:"1700000000:example.com";}'
+        with patch.object(search_replace, "_classify_serialized_value", wraps=search_replace._classify_serialized_value) as classify:
+            results = {_safe_replace_in_serialized_data(value, "example.com", "example.org") for _ in range(5)}
+
+        assert results == {'a:1:{s:4:"lock";s:23:"1700000000:example.org";}'}
+        assert classify.call_count == 1
+
+    @pytest.mark.unit
+    def test_php_serialized_without_match_is_untouched(self):
+        """Test that values without the search term are returned as-is"""
+        malformed = 'a:1:{s:4:"name";s:999:"Hello";}'
+        assert _safe_replace_in_serialized_data(malformed, "World", "Universe") == malformed
+        assert _replace_in_php_serialized(malformed, "World", "Universe") == malformed
+
+    @pytest.mark.unit
+    def test_binary_values_are_decoded_as_text(self):
+        """Test that bytes values are only decoded when they contain the search term"""
+        from search_replace import _decode_cell
+
+        value = b'a:1:{s:4:"name";s:5:"Hello";}'
+        assert _decode_cell(value, b"World") is None
+        assert _decode_cell(value, b"Hello") == 'a:1:{s:4:"name";s:5:"Hello";}'
+        assert _decode_cell(b'\xff\xfeHello', b"Hello") is None
+        assert _decode_cell("text", b"Hello") == "text"
+        assert _decode_cell(42, b"Hello") == "42"
+
     @pytest.mark.unit
     def test_edge_cases(self):
         """Test edge cases and error handling"""
@@ -157,6 +301,22 @@ class TestSearchReplace:
         assert parsed["config"]["urls"][0] == "https://new-server.com"
         assert parsed["config"]["urls"][1] == "https://api.new-server.com"
 
+    @pytest.mark.unit
+    def test_deeply_nested_json_replacement(self):
+        """Test that JSON nested deeper than the recursion limit is still handled"""
+        data = inner = []
+        for _ in range(5000):
+            inner.append([])
+            inner = inner[0]
+        inner.append("https://old-server.com")
+
+        result = _replace_in_json_object(data, "old-server.com", "new-server.com")
+        assert result is data
+        assert inner == ["https://new-server.com"]
+
+        # Values without the search term are returned without being re-serialized
+        assert _replace_in_json_data('{"a": 1}', "old-server.com", "new-server.com") == '{"a": 1}'
+
 
 class TestSearchReplaceSession:
     """Test the SearchReplaceSession class"""
@@ -192,11 +352,19 @@ class TestSearchReplaceSession:
 
         assert backup_data["search_term"] == "test"
         assert backup_data["replace_term"] == "replacement"
-        assert backup_data["changes"] == []
+        assert backup_data["changes_file"] == session.changes_file.name
         assert "timestamp" in backup_data
 
+        # Changes are appended to a separate, initially empty, JSON lines file
+        assert session.changes_file.read_text() == ""
+        session.append_backup_changes([{"row_id": 1, "column": "title"}, {"row_id": 2, "column": "title"}])
+        session.append_backup_changes([{"row_id": 3, "column": "title"}])
+        lines = session.changes_file.read_text().splitlines()
+        assert [json.loads(line)["row_id"] for line in lines] == [1, 2, 3]
+
         # Clean up
         backup_file.unlink()
+        session.changes_file.unlink()
 
     @pytest.mark.unit
     def test_dry_run_safety(self):
@@ -254,6 +422,20 @@ class TestSearchReplaceSession:
         assert "example.com" in summary2, "Summary should contain search term"
         assert "content:" in summary2, "Summary should show matching column"
 
+    @pytest.mark.unit
+    def test_row_summary_stops_after_three_matches(self):
+        """Test that the row summary stops reading columns once three of them matched"""
+        class Unreadable:
+            def __str__(self):
+                raise AssertionError("column read after the third match")
+
+        class MockRow:
+            _mapping = {'a': 'x term', 'b': None, 'c': 'TERM y', 'd': 'term', 'e': Unreadable()}
+
+        from search_replace import _create_row_summary
+
+        assert _create_row_summary(MockRow(), "term") == "a: x term | c: TERM y | d: term"
+
     @pytest.mark.unit
     def test_serialized_data_single_line_format(self):
         """Test that serialized data is formatted as single-line strings without line breaks"""
@@ -370,3 +552,128 @@ class TestSearchReplaceSession:
         # Verify the structure is still valid
         assert result.startswith('s:14:"')
         assert result.endswith('";')
+
+
+class TestExecuteReplace:
+    """Test the replace execution against a real (SQLite) database"""
+
+    @staticmethod
+    def _make_session(row_ids):
+        session = SearchReplaceSession()
+        session.search_term = "example.com"
+        session.replace_term = "newdomain.org"
+        session.selected_tables = ["wp_options"]
+        session.search_results = {"wp_options": [object() for _ in row_ids]}
+        session.selected_rows = {"wp_options": list(row_ids)}
+        return session
+
+    @staticmethod
+    def _values(engine):
+        from sqlalchemy.sql import text
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT option_id, option_value FROM wp_options"))
+            return {row[0]: row[1] for row in rows}
+
+    @pytest.mark.unit
+    def test_dry_run_leaves_database_untouched(self, sqlite_wp_engine):
+        """Dry run should report changes without writing them"""
+        from search_replace import _execute_replace
+
+        before = self._values(sqlite_wp_engine)
+        _execute_replace(self._make_session([1, 2, 3]), dry_run=True)
+
+        assert self._values(sqlite_wp_engine) == before
+
+    @pytest.mark.unit
+    def test_replacement_cache_is_cleared_after_run(self, sqlite_wp_engine):
+        """Cached replacements don't outlive the run that made them"""
+        from search_replace import _execute_replace, _replace_by_kind
+
+        _execute_replace(self._make_session([1, 2, 3]), dry_run=True)
+
+        assert _replace_by_kind.cache_info().currsize == 0
+
+    @pytest.mark.unit
+    def test_replace_updates_selected_rows(self, sqlite_wp_engine):
+        """Selected rows are updated in batches and recorded in the backup file"""
+        from search_replace import _execute_replace
+
+        session = self._make_session([1, 3, 4, 99])
+        with patch('search_replace.inquirer.prompt', return_value={"confirm": True}):
+            _execute_replace(session, dry_run=False)
+
+        try:
+            values = self._values(sqlite_wp_engine)
+            assert values[1] == "https://newdomain.org"
+            assert values[2] == "https://example.com/home"  # not selected
+            assert values[3] == 'a:1:{s:3:"url";s:21:"https://newdomain.org";}'
+            assert values[4] == "My Blog"
+
+            with open(session.changes_file, 'r') as f:
+                changes = [json.loads(line) for line in f]
+            changed = {(change["row_id"], change["column"]) for change in changes}
+            assert changed == {(1, "option_value"), (3, "option_value")}
+        finally:
+            session.backup_file.unlink()
+            session.changes_file.unlink()
+
+    @pytest.mark.unit
+    def test_undo_restores_original_values(self, sqlite_wp_engine):
+        """Undo restores every changed value from the newest backup file"""
+        from search_replace import _execute_replace, _undo_last_operation
+
+        before = self._values(sqlite_wp_engine)
+        session = self._make_session([1, 2, 3])
+        with patch('search_replace.inquirer.prompt', return_value={"confirm": True}):
+            _execute_replace(session, dry_run=False)
+        assert self._values(sqlite_wp_engine) != before
+
+        answers = iter([
+            lambda questions: {"backup_choice": questions[0].choices[0].value},
+            lambda questions: {"confirm_undo": True},
+        ])
+        used_file = session.backup_file.with_suffix('.json.used')
+        try:
+            with patch('search_replace.inquirer.prompt', side_effect=lambda questions: next(answers)(questions)):
+                _undo_last_operation()
+
+            assert self._values(sqlite_wp_engine) == before
+            assert used_file.exists()
+        finally:
+            for path in (session.backup_file, used_file, session.changes_file):
+                if path.exists():
+                    path.unlink()
+
+
+class TestFindMatches:
+    """Test finding matches across tables against a real (SQLite) database"""
+
+    @pytest.mark.unit
+    def test_tables_are_searched_and_reported_in_order(self, sqlite_wp_engine, capsys):
+        """Test that matches are collected per table and a failing table does not stop the others"""
+        from search_replace import _find_matches
+
+        session = SearchReplaceSession()
+        session.search_term = "example.com"
+        session.selected_tables = ["missing_table", "wp_options"]
+
+        _find_matches(session)
+
+        assert [row.option_id for row in session.search_results["wp_options"]] == [1, 2, 3]
+        assert "missing_table" not in session.search_results
+        output = capsys.readouterr().out
+        assert output.index("Searching missing_table") < output.index("Searching wp_options")
+        assert "Found 3 matches in wp_options" in output
+
+    @pytest.mark.unit
+    def test_wildcards_in_the_term_are_literal(self, sqlite_wp_engine):
+        """Test that _ and % in the search term don't match other characters"""
+        from search_replace import _find_matches
+
+        session = SearchReplaceSession()
+        session.search_term = "site_rl"
+        session.selected_tables = ["wp_options"]
+
+        _find_matches(session)
+
+        assert "wp_options" not in session.search_results
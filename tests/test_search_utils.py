@@ -0,0 +1,692 @@
+"""
+Test module for the search functions
+Searches run against an in-memory SQLite database with scripted prompt answers.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+import search_utils
+
+
+@pytest.fixture(autouse=True)
+def forget_export_selection():
+    """Start every test without a remembered export meta key selection"""
+    search_utils._last_export_meta_keys.clear()
+    yield
+    search_utils._last_export_meta_keys.clear()
+
+
+def _run_search(search, answers, inputs, **kwargs):
+    """Run a search with scripted prompt answers and console input"""
+    answers = iter(answers)
+    inputs = iter(inputs)
+    with patch('search_utils.inquirer.prompt', side_effect=lambda questions: {questions[0].name: next(answers)}), \
+         patch('search_utils.console.input', side_effect=lambda *args: next(inputs)):
+        return search(**kwargs)
+
+
+class TestSearchUsers:
+    """Test the user search"""
+
+    @pytest.mark.unit
+    def test_field_search_export(self, sqlite_search_engine):
+        """Test that an all-fields export search returns the query and selected meta keys"""
+        query, params, meta_info = _run_search(
+            search_utils.search_users,
+            ["1. Search by user fields", "All fields (general search)", ["first_name"]],
+            ["user2"],
+            export_mode=True,
+        )
+
+        assert query.startswith(f"SELECT * FROM `{search_utils.users_table}` WHERE")
+        # Only columns that can hold text are searched
+        assert "`user_email` LIKE :search_term" in query
+        assert "`ID`" not in query and "`user_registered`" not in query
+        assert params == {"search_term": "%user2%"}
+        assert meta_info["count"] == 1
+        assert meta_info["export_meta_keys"] == ["first_name"]
+        assert meta_info["is_meta"] is False
+
+    @pytest.mark.unit
+    def test_meta_search_export(self, sqlite_search_engine):
+        """Test that a meta export search counts the matching users"""
+        query, params, meta_info = _run_search(
+            search_utils.search_users,
+            ["2. Search by user meta data", "first_name", "Contains", ["nickname"]],
+            ["first", "name_3"],
+            export_mode=True,
+        )
+
+        assert params == {"meta_key": "first_name", "search_term": "%name!_3%"}
+        assert meta_info["count"] == 1
+        assert meta_info["meta_key"] == "first_name"
+        assert meta_info["export_meta_keys"] == ["nickname"]
+
+    @pytest.mark.unit
+    def test_id_list_is_bound_as_integers(self, sqlite_search_engine):
+        """Test that a user ID list is converted to integers and rejected if it isn't numeric"""
+        answers = ["1. Search by user fields", "ID", "In list (comma separated)", []]
+        query, params, meta_info = _run_search(search_utils.search_users, answers, ["1, 3"], export_mode=True)
+
+        assert params == {"terms": [1, 3]}
+        assert meta_info["count"] == 2
+
+        assert _run_search(search_utils.search_users, answers[:3], ["1, x"], export_mode=True) is None
+
+    @pytest.mark.unit
+    def test_meta_search_export_without_matches(self, sqlite_search_engine):
+        """Test that no export meta keys are asked for when nothing matches"""
+        result = _run_search(
+            search_utils.search_users,
+            ["2. Search by user meta data", "first_name", "Contains"],
+            ["", "no such value"],
+            export_mode=True,
+        )
+
+        assert result is None
+
+
+    @pytest.mark.unit
+    def test_field_search_display_skips_count(self, sqlite_search_engine, capsys):
+        """Test that a displayed field search reports the rows fetched without a COUNT query"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        result = _run_search(
+            search_utils.search_users,
+            ["1. Search by user fields", "user_login", "Contains"],
+            ["user"],
+        )
+
+        assert result is None
+        assert "Found 5 matching users" in capsys.readouterr().out
+        assert not any("COUNT(" in statement for statement in statements)
+
+    @pytest.mark.unit
+    def test_in_list_search_reuses_statement(self, sqlite_search_engine, capsys):
+        """Test that in-list searches of any length share one expanding statement"""
+        search_utils._cached_text.cache_clear()
+        for value in ("user1, user2", "user1, user3, user5"):
+            _run_search(
+                search_utils.search_users,
+                ["1. Search by user fields", "user_login", "In list (comma separated)"],
+                [value],
+            )
+
+        output = capsys.readouterr().out
+        assert "Found 2 matching users" in output
+        assert "Found 3 matching users" in output
+        assert search_utils._cached_text.cache_info().currsize == 1
+
+    @pytest.mark.unit
+    def test_in_list_export_executes_with_list_param(self, sqlite_search_engine):
+        """Test that an exported in-list query runs with its list parameter"""
+        query, params, meta_info = _run_search(
+            search_utils.search_users,
+            ["2. Search by user meta data", "first_name", "In list (comma separated)", []],
+            ["", "first_name_1, first_name_4"],
+            export_mode=True,
+        )
+
+        assert params["terms"] == ["first_name_1", "first_name_4"]
+        assert meta_info["count"] == 2
+        with sqlite_search_engine.connect() as connection:
+            rows = connection.execute(search_utils.search_text(query, params), params).fetchall()
+        assert sorted(row.user_login for row in rows) == ["user1", "user4"]
+
+    @pytest.mark.unit
+    def test_meta_search_display_streams_rows(self, sqlite_search_engine, capsys):
+        """Test that a displayed meta search counts the rows streamed into the table"""
+        result = _run_search(
+            search_utils.search_users,
+            ["2. Search by user meta data", "nickname", "Contains"],
+            ["", "nick"],
+        )
+
+        assert result is None
+        output = capsys.readouterr().out
+        assert "Found 5 matching users" in output
+        assert "User Search Results" in output
+
+
+    @pytest.mark.unit
+    def test_date_validation_is_cached(self):
+        """Test that user-entered dates are validated against YYYY-MM-DD once per distinct value"""
+        search_utils._is_valid_date.cache_clear()
+
+        assert search_utils._is_valid_date("2024-02-29")
+        assert not search_utils._is_valid_date("2023-02-29")
+        assert not search_utils._is_valid_date("29/02/2024")
+        assert search_utils._is_valid_date("2024-02-29")
+        assert search_utils._is_valid_date.cache_info().hits == 1
+
+
+class TestSearchDatabase:
+    """Test the main search menu"""
+
+    @pytest.mark.unit
+    def test_menu_runs_selected_search(self):
+        """Test that a menu entry runs its search and Back runs nothing"""
+        with patch('search_utils.general_search') as general_search, \
+             patch('search_utils.search_posts') as search_posts:
+            _run_search(search_utils.search_database, ["7. General Search"], [])
+            _run_search(search_utils.search_database, ["5. Search Pages"], [])
+            _run_search(search_utils.search_database, ["Back"], [])
+
+        general_search.assert_called_once_with()
+        search_posts.assert_called_once_with(post_type="page", display_name="Page")
+
+
+class TestGeneralSearch:
+    """Test the search across all tables"""
+
+    @pytest.mark.unit
+    def test_columns_are_reflected_once(self, sqlite_search_engine, capsys):
+        """Test that repeated general searches reuse the reflected table columns"""
+        with patch('search_utils.view_results') as view_results:
+            _run_search(search_utils.general_search, [], ["lock_2"])
+            misses = search_utils._cached_columns.cache_info().misses
+            _run_search(search_utils.general_search, [], ["lock_2"])
+
+        assert search_utils._cached_columns.cache_info().misses == misses
+        assert search_utils._searchable_column_names.cache_info().hits >= len(search_utils._cached_table_names())
+        table_results = view_results.call_args[0][1]
+        assert table_results == {search_utils.postmeta_table: 1}
+
+    @pytest.mark.unit
+    def test_tables_are_counted_in_one_query(self, sqlite_search_engine):
+        """Test that the table counts are fetched with a single UNION ALL query"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        with patch('search_utils.view_results') as view_results:
+            _run_search(search_utils.general_search, [], ["user3"])
+
+        count_statements = [statement for statement in statements if "COUNT(*)" in statement]
+        assert len(count_statements) == 1 and "UNION ALL" in count_statements[0]
+        assert view_results.call_args[0][1] == {search_utils.users_table: 1}
+
+    @pytest.mark.unit
+    def test_empty_term_runs_no_queries(self, sqlite_search_engine, capsys):
+        """Test that an empty search term is rejected before any table is counted"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        with patch('search_utils.view_results') as view_results:
+            _run_search(search_utils.general_search, [], ["   "])
+
+        assert statements == []
+        view_results.assert_not_called()
+        assert "Please enter a search term" in capsys.readouterr().out
+
+    @pytest.mark.unit
+    def test_wildcards_in_term_are_literal(self, sqlite_search_engine, capsys):
+        """Test that % and _ in the search term only match themselves"""
+        with patch('search_utils.view_results') as view_results:
+            _run_search(search_utils.general_search, [], ["%"])
+
+        view_results.assert_not_called()
+        assert search_utils._contains_pattern("50%_off!") == "%50!%!_off!!%"
+
+    @pytest.mark.unit
+    def test_failing_table_is_counted_alone(self, sqlite_search_engine, capsys):
+        """Test that a table whose query fails is reported while the other tables are still counted"""
+        searchable_column_names = search_utils._searchable_column_names
+
+        def column_names(table_name):
+            if table_name == search_utils.usermeta_table:
+                return ["missing_column"]
+            return searchable_column_names(table_name)
+
+        with patch('search_utils._searchable_column_names', side_effect=column_names), \
+             patch('search_utils.view_results') as view_results:
+            _run_search(search_utils.general_search, [], ["lock_2"])
+
+        assert view_results.call_args[0][1] == {search_utils.postmeta_table: 1}
+        assert f"Error searching table {search_utils.usermeta_table}" in capsys.readouterr().out
+
+    @pytest.mark.unit
+    def test_only_text_columns_are_searched(self, sqlite_search_engine, capsys):
+        """Test that numeric and date columns are left out of the general search"""
+        with patch('search_utils.view_results') as view_results:
+            _run_search(search_utils.general_search, [], ["2024-01-01"])
+
+        view_results.assert_not_called()
+        assert "No matching results found" in capsys.readouterr().out
+
+    @pytest.mark.unit
+    def test_view_results_streams_matching_rows(self, sqlite_search_engine, capsys):
+        """Test that viewing a table's results shows the rows streamed from the query"""
+        table_results = {search_utils.postmeta_table: 1}
+        with patch('search_utils.inquirer.prompt', return_value={"selected_table": search_utils.postmeta_table}):
+            search_utils.view_results(sqlite_search_engine, table_results, "lock_2")
+            search_utils.view_results(sqlite_search_engine, table_results, "no such value")
+
+        output = capsys.readouterr().out
+        assert "_edit_lock_2" in output
+        assert "No rows found" in output
+
+
+    @pytest.mark.unit
+    def test_view_results_pages_by_primary_key(self, sqlite_search_engine, capsys):
+        """Test that further result pages continue after the last primary key shown"""
+        from sqlalchemy import event
+        from sqlalchemy.sql import text
+
+        with sqlite_search_engine.begin() as connection:
+            connection.execute(
+                text(f"INSERT INTO {search_utils.postmeta_table} (post_id, meta_key, meta_value) VALUES (1, 'bulk', :value)"),
+                [{"value": f"bulk_{i}"} for i in range(120)],
+            )
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters)))
+
+        answers = iter([{"selected_table": search_utils.postmeta_table}, {"next_page": "Show next 100"}])
+        with patch('search_utils.inquirer.prompt', side_effect=lambda questions: next(answers)):
+            search_utils.view_results(sqlite_search_engine, {search_utils.postmeta_table: 120}, "bulk")
+
+        pages = [(statement, parameters) for statement, parameters in statements if "ORDER BY `meta_id`" in statement]
+        assert len(pages) == 2
+        assert "`meta_id` > ?" in pages[1][0] and "OFFSET" not in pages[1][0]
+        output = capsys.readouterr().out
+        assert "page 2" in output and "bulk_119" in output
+
+
+class TestGetEngine:
+    """Test the lazily created search engine"""
+
+    @pytest.mark.unit
+    def test_search_connections_autocommit(self):
+        """Test that search connections run without an implicit transaction"""
+        from sqlalchemy import create_engine
+
+        with patch.object(search_utils, 'engine', None), \
+             patch('search_utils.check_db_connection_with_friendly_error', return_value=True), \
+             patch('search_utils.get_db_engine', return_value=create_engine("sqlite://")):
+            with search_utils.get_engine().connect() as connection:
+                assert connection.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+
+    @pytest.mark.unit
+    def test_concurrent_calls_create_one_engine(self):
+        """Test that worker threads asking for the engine at once only connect once"""
+        import time
+        import concurrent.futures
+        from sqlalchemy import create_engine
+
+        def slow_check():
+            time.sleep(0.05)
+            return True
+
+        with patch.object(search_utils, 'engine', None), \
+             patch('search_utils.check_db_connection_with_friendly_error', side_effect=slow_check) as check, \
+             patch('search_utils.get_db_engine', return_value=create_engine("sqlite://")):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                engines = list(executor.map(lambda _: search_utils.get_engine(), range(8)))
+
+        assert check.call_count == 1
+        assert all(engine is engines[0] for engine in engines)
+
+
+class TestEnvSettings:
+    """Test reading numeric settings from the environment"""
+
+    @pytest.mark.unit
+    def test_invalid_number_falls_back_to_default(self, monkeypatch, capsys):
+        """Test that a setting which isn't a whole number is ignored with a warning"""
+        monkeypatch.setenv('META_KEY_SCOPE_LIMIT', 'lots')
+        assert search_utils._env_int('META_KEY_SCOPE_LIMIT') == 0
+        assert "META_KEY_SCOPE_LIMIT" in capsys.readouterr().out
+
+        monkeypatch.setenv('META_KEY_SCOPE_LIMIT', '200')
+        assert search_utils._env_int('META_KEY_SCOPE_LIMIT') == 200
+
+
+class TestSelectMetaKey:
+    """Test the meta key prompt"""
+
+    @pytest.mark.unit
+    def test_short_list_uses_inquirer(self):
+        """Test that short meta key lists are shown as an inquirer list ending with Back"""
+        with patch('search_utils.inquirer.prompt', return_value={"meta_key": "nickname"}) as prompt:
+            assert search_utils._select_meta_key(("first_name", "nickname")) == "nickname"
+
+        assert list(prompt.call_args[0][0][0].choices) == ["first_name", "nickname", "Back"]
+
+    @pytest.mark.unit
+    def test_long_list_uses_autocomplete(self):
+        """Test that long meta key lists use autocomplete and a cancelled prompt goes back"""
+        meta_keys = tuple(f"key_{i}" for i in range(search_utils.META_KEY_AUTOCOMPLETE_THRESHOLD + 1))
+        fake_questionary = MagicMock()
+        fake_questionary.autocomplete.return_value.ask.side_effect = ["key_7", None]
+
+        with patch.object(search_utils, 'QUESTIONARY_AVAILABLE', True), \
+             patch.object(search_utils, 'questionary', fake_questionary, create=True), \
+             patch('search_utils.inquirer.prompt') as prompt:
+            assert search_utils._select_meta_key(meta_keys) == "key_7"
+            assert search_utils._select_meta_key(meta_keys) == "Back"
+
+        prompt.assert_not_called()
+        assert fake_questionary.autocomplete.call_args[1]["choices"][-1] == "Back"
+
+
+    @pytest.mark.unit
+    def test_long_export_list_is_filtered_by_prefix(self):
+        """Test that long export meta key lists are narrowed by a prefix before the checkbox list"""
+        meta_keys = tuple(f"key_{i}" for i in range(search_utils.EXPORT_META_KEY_CHECKBOX_LIMIT + 1))
+
+        with patch('search_utils.console.input', return_value="key_4"), \
+             patch('search_utils.inquirer.prompt', return_value={"selected_meta_keys": ["key_4"]}) as prompt:
+            assert search_utils._select_export_meta_keys(meta_keys) == ["key_4"]
+
+        choices = [choice.value for choice in prompt.call_args[0][0][0].choices]
+        assert choices == ["key_4"] + [f"key_{i}" for i in range(40, 50)]
+
+    @pytest.mark.unit
+    def test_long_export_list_without_prefix_is_typed(self):
+        """Test that export meta keys are typed in when a long list is not filtered"""
+        meta_keys = tuple(f"key_{i}" for i in range(search_utils.EXPORT_META_KEY_CHECKBOX_LIMIT + 1))
+
+        with patch('search_utils.console.input', side_effect=["", "key_1, key_2,"]), \
+             patch('search_utils.inquirer.prompt') as prompt:
+            assert search_utils._select_export_meta_keys(meta_keys) == ["key_1", "key_2"]
+
+        prompt.assert_not_called()
+
+
+    @pytest.mark.unit
+    def test_recent_export_selection_is_offered_again(self):
+        """Test that a recent export meta key selection can be reused without the checkbox list"""
+        meta_keys = ("first_name", "nickname")
+        with patch('search_utils.inquirer.prompt', return_value={"selected_meta_keys": ["nickname"]}):
+            assert search_utils._select_export_meta_keys(meta_keys, meta_table="usermeta") == ["nickname"]
+
+        with patch('search_utils.inquirer.prompt', return_value={"reuse_meta_keys": True}) as prompt:
+            assert search_utils._select_export_meta_keys(meta_keys, meta_table="usermeta") == ["nickname"]
+        assert prompt.call_count == 1
+
+        with patch('search_utils.inquirer.prompt', return_value={"selected_meta_keys": []}) as prompt:
+            assert search_utils._select_export_meta_keys(meta_keys, "post", "postmeta", "post") == []
+        assert prompt.call_args[0][0][0].name == "selected_meta_keys"
+
+
+class TestMetaKeyIndexHint:
+    """Test the index hint used by meta searches"""
+
+    @pytest.mark.unit
+    def test_no_hint_outside_mysql(self, sqlite_search_engine):
+        """Test that other databases get no index hint"""
+        assert search_utils._meta_key_index_hint(search_utils.usermeta_table) == ""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("dialect", ["mysql", "mariadb"])
+    def test_mysql_hint_and_index_suggestion(self, capsys, dialect):
+        """Test that MySQL and MariaDB use the meta_key index and suggest a meta_value index once"""
+        engine = MagicMock()
+        engine.dialect.name = dialect
+        inspector = MagicMock()
+        inspector.get_indexes.return_value = [
+            {"name": "meta_key", "column_names": ["meta_key"]},
+            {"name": "user_id", "column_names": ["user_id"]},
+        ]
+
+        search_utils._meta_key_index_hint.cache_clear()
+        try:
+            with patch('search_utils.get_engine', return_value=engine), \
+                 patch('search_utils.get_inspector', return_value=inspector):
+                assert search_utils._meta_key_index_hint("wp_usermeta") == "USE INDEX (meta_key)"
+                assert search_utils._meta_key_index_hint("wp_usermeta") == "USE INDEX (meta_key)"
+        finally:
+            search_utils._meta_key_index_hint.cache_clear()
+
+        assert inspector.get_indexes.call_count == 1
+        assert capsys.readouterr().out.count("ADD INDEX meta_key_value") == 1
+
+
+class TestFulltextSearch:
+    """Test the full-text word search offered for FULLTEXT indexed columns"""
+
+    @pytest.mark.unit
+    def test_indexed_columns_on_mysql(self):
+        """Test that only single-column FULLTEXT indexes are picked up"""
+        engine = MagicMock()
+        engine.dialect.name = "mysql"
+        inspector = MagicMock()
+        inspector.get_indexes.return_value = [
+            {"name": "post_title", "column_names": ["post_title"], "dialect_options": {"mysql_prefix": "FULLTEXT"}},
+            {"name": "title_content", "column_names": ["post_title", "post_content"], "dialect_options": {"mysql_prefix": "FULLTEXT"}},
+            {"name": "post_name", "column_names": ["post_name"]},
+        ]
+
+        search_utils._fulltext_indexed_columns.cache_clear()
+        try:
+            with patch('search_utils.get_engine', return_value=engine), \
+                 patch('search_utils.get_inspector', return_value=inspector):
+                assert search_utils._fulltext_indexed_columns("wp_posts") == ("post_title",)
+        finally:
+            search_utils._fulltext_indexed_columns.cache_clear()
+
+    @pytest.mark.unit
+    def test_no_indexed_columns_outside_mysql(self, sqlite_search_engine):
+        """Test that other databases are not offered the full-text match type"""
+        assert search_utils._fulltext_indexed_columns(search_utils.posts_table) == ()
+
+    @pytest.mark.unit
+    def test_boolean_terms_require_every_word(self):
+        """Test that every word is required and boolean mode operators are dropped"""
+        assert search_utils._fulltext_boolean_terms("summer sale") == "+summer +sale"
+        assert search_utils._fulltext_boolean_terms(' -"big" (deal)* ') == "+big +deal"
+
+
+class TestSearchPosts:
+    """Test the post search"""
+
+    @pytest.mark.unit
+    def test_field_search_export_binds_post_type(self, sqlite_search_engine):
+        """Test that the post type is passed as a bound parameter"""
+        query, params, meta_info = _run_search(
+            search_utils.search_posts,
+            ["1. Search by post fields", "post_status", "Exact match", []],
+            ["publish"],
+            post_type="page",
+            export_mode=True,
+            display_name="Page",
+        )
+
+        assert "post_type = :post_type" in query
+        assert "'page'" not in query
+        assert params == {"term": "publish", "post_type": "page"}
+        assert meta_info["count"] == 2
+
+    @pytest.mark.unit
+    def test_field_search_export_prefetches_small_results(self, sqlite_search_engine, monkeypatch):
+        """Test that small export results are read with the count and larger ones are only counted"""
+        from sqlalchemy import event
+
+        answers = ["1. Search by post fields", "post_status", "Exact match", []]
+        query, params, meta_info = _run_search(
+            search_utils.search_posts, answers, ["publish"], post_type="post", export_mode=True, display_name="Post")
+
+        column_names, rows = meta_info["prefetched_rows"]
+        assert meta_info["count"] == len(rows) == 3
+        assert "post_title" in column_names
+
+        monkeypatch.setattr(search_utils, 'EXPORT_PREFETCH_ROWS', 2)
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        query, params, meta_info = _run_search(
+            search_utils.search_posts, answers, ["publish"], post_type="post", export_mode=True, display_name="Post")
+
+        assert meta_info["count"] == 3
+        assert meta_info["prefetched_rows"] is None
+        assert not any("SELECT *" in statement for statement in statements)
+
+    @pytest.mark.unit
+    def test_id_list_is_bound_as_integers(self, sqlite_search_engine):
+        """Test that a post ID list is bound as one expanding Integer parameter"""
+        from sqlalchemy import Integer
+
+        query, params, meta_info = _run_search(
+            search_utils.search_posts,
+            ["1. Search by post fields", "ID", "In list (comma separated)", []],
+            ["1, 3, 5"],
+            post_type="post",
+            export_mode=True,
+            display_name="Post",
+        )
+
+        assert params["terms"] == [1, 3, 5]
+        assert meta_info["count"] == 2
+        terms = search_utils.search_text(query, params)._bindparams["terms"]
+        assert terms.expanding and isinstance(terms.type, Integer)
+        assert search_utils.search_text(query, {**params, "terms": [2]}) is search_utils.search_text(query, params)
+
+    @pytest.mark.unit
+    def test_meta_search_export(self, sqlite_search_engine):
+        """Test that a meta export search on posts counts the matching posts"""
+        query, params, meta_info = _run_search(
+            search_utils.search_posts,
+            ["2. Search by post meta data", "_edit_lock", "Contains", ["_thumbnail_id"]],
+            ["", "lock_2"],
+            post_type="post",
+            export_mode=True,
+            display_name="Post",
+        )
+
+        assert params["meta_key"] == "_edit_lock"
+        assert meta_info["count"] == 1
+        assert meta_info["export_meta_keys"] == ["_thumbnail_id"]
+
+    @pytest.mark.unit
+    def test_field_search_display_skips_count(self, sqlite_search_engine, capsys):
+        """Test that a displayed post field search reports the rows fetched without a COUNT query"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        result = _run_search(
+            search_utils.search_posts,
+            ["1. Search by post fields", "post_status", "Exact match"],
+            ["publish"],
+            post_type="post",
+            display_name="Post",
+        )
+
+        assert result is None
+        assert "Found 3 matching posts" in capsys.readouterr().out
+        assert not any("COUNT(" in statement for statement in statements)
+
+    @pytest.mark.unit
+    def test_field_search_display_pages_by_keyset(self, sqlite_search_engine, monkeypatch, capsys):
+        """Test that further pages continue after the last post shown instead of using OFFSET"""
+        from sqlalchemy import event
+
+        monkeypatch.setattr(search_utils, 'POST_PAGE_SIZE', 2)
+        pages = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, parameters, *args: pages.append((statement, parameters)))
+        _run_search(
+            search_utils.search_posts,
+            ["1. Search by post fields", "post_status", "Exact match", "Show next 2"],
+            ["publish"],
+            post_type="post",
+            display_name="Post",
+        )
+
+        output = capsys.readouterr().out
+        assert "Found 2+ matching posts" in output
+        assert "page 2" in output
+        statement, parameters = pages[-1]
+        assert "OFFSET" not in statement
+        # All posts share a post_date, so the ID breaks the tie
+        assert 2 in tuple(parameters)
+        assert sum("ORDER BY post_date DESC, ID DESC" in page for page, _ in pages) == 2
+
+    @pytest.mark.unit
+    def test_meta_search_display_fetches_content_prefix(self, sqlite_search_engine, capsys):
+        """Test that a displayed meta search only fetches the start of post_content"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        _run_search(
+            search_utils.search_posts,
+            ["2. Search by post meta data", "_edit_lock", "Contains"],
+            ["", "lock_2"],
+            post_type="post",
+            display_name="Post",
+        )
+
+        assert "Found 1 matching posts" in capsys.readouterr().out
+        assert any("SUBSTRING(p.post_content, 1, 101)" in statement for statement in statements)
+
+    @pytest.mark.unit
+    def test_results_table_shortens_post_content(self):
+        """Test that only post_content is cut to 100 characters in the results table"""
+        table = search_utils._post_results_table(
+            ["ID", "post_title", "post_content"], [(1, "t" * 101, "c" * 101), (2, None, "short")], "Posts")
+
+        assert table.row_count == 2
+        assert list(table.columns[2].cells) == ["c" * 100 + "...", "short"]
+        assert list(table.columns[1].cells) == ["t" * 101, ""]
+
+    @pytest.mark.unit
+    def test_meta_export_lists_meta_keys_once(self, sqlite_search_engine):
+        """Test that the search and export meta key prompts share one meta key listing"""
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(sqlite_search_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        query, params, meta_info = _run_search(
+            search_utils.search_posts,
+            ["2. Search by post meta data", "_thumbnail_id", "Exact match", ["_edit_lock"]],
+            ["", "_thumbnail_id_2"],
+            post_type="post",
+            export_mode=True,
+            display_name="Post",
+        )
+
+        assert meta_info["count"] == 1
+        assert meta_info["export_meta_keys"] == ["_edit_lock"]
+        assert sum("GROUP BY pm.meta_key" in statement for statement in statements) == 1
+
+    @pytest.mark.unit
+    def test_meta_keys_are_limited_to_post_type_and_cached(self, sqlite_search_engine):
+        """Test that post meta keys only come from posts of the type and are read once"""
+        from sqlalchemy.sql import text
+
+        meta_keys = search_utils._distinct_meta_keys(search_utils.postmeta_table, post_type="post")
+        assert meta_keys == ("_edit_lock", "_thumbnail_id")
+        assert search_utils._distinct_meta_keys(search_utils.postmeta_table, "_thumb", "page") == ()
+
+        with sqlite_search_engine.begin() as connection:
+            connection.execute(text(f"DELETE FROM {search_utils.postmeta_table}"))
+        assert search_utils._distinct_meta_keys(search_utils.postmeta_table, "", "post") == meta_keys
+
+        search_utils.clear_schema_cache()
+        assert search_utils._distinct_meta_keys(search_utils.postmeta_table, post_type="post") == ()
+
+    @pytest.mark.unit
+    def test_meta_key_scope_limits_listing_to_recent_posts(self, sqlite_search_engine, monkeypatch):
+        """Test that a meta key scope lists keys of the most recent posts only, unless a prefix is given"""
+        from sqlalchemy.sql import text
+
+        with sqlite_search_engine.begin() as connection:
+            connection.execute(text(
+                f"INSERT INTO {search_utils.postmeta_table} (post_id, meta_key, meta_value) VALUES (1, 'old_key', 'x')"
+            ))
+        monkeypatch.setattr(search_utils, 'META_KEY_SCOPE_LIMIT', 2)
+
+        assert search_utils._distinct_meta_keys(search_utils.postmeta_table, post_type="post") == ("_edit_lock", "_thumbnail_id")
+        assert search_utils._distinct_meta_keys(search_utils.postmeta_table, "old", "post") == ("old_key",)